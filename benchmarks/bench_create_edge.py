@@ -0,0 +1,46 @@
+"""Benchmark edge insertion in checked, unchecked and bulk mode.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/bench_create_edge.py [edges]
+"""
+import sys
+from time import perf_counter
+
+from jag import Graph
+
+
+def pairs(count):
+    """A de Bruijn like edge list with out- and in-degree of 2."""
+    nodes = count // 2
+    return [(i, (2 * i + j) % nodes) for i in range(nodes) for j in (0, 1)]
+
+
+def run(edges, checked):
+    graph = Graph(checked=checked)
+    start = perf_counter()
+    for tail, head in edges:
+        graph.create_edge(tail, head)
+    return perf_counter() - start
+
+
+def run_bulk(edges):
+    graph = Graph()
+    start = perf_counter()
+    graph.add_edges_from(edges)
+    return perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    edges = pairs(count)
+    for checked in (True, False):
+        seconds = run(edges, checked)
+        print('checked={!s:5} {:>12,.0f} edges/s'.format(
+            checked, len(edges) / seconds))
+    seconds = run_bulk(edges)
+    print('bulk          {:>12,.0f} edges/s'.format(len(edges) / seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark the depth first search on a long path and a wide tree.
+
+Compares the iterative engine with the former recursive one where the
+recursive one can run at all. Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/bench_dfs.py [nodes]
+"""
+import sys
+from time import perf_counter
+
+from jag import DepthFirstSearch
+from jag import Graph
+
+
+class RecursiveDepthFirstSearch(DepthFirstSearch):
+    """The recursive engine as reference."""
+
+    def _dfs(self, node, seen):
+        if node in seen:
+            raise self.CycleInDAG(node)
+        self._entry(node)
+        seen.add(node)
+        if len(self._graph.successors(node)) == 0:
+            self._leaf(node)
+        else:
+            for child in self._graph.successors(node):
+                self._dfs(child, seen)
+        self._exit(node)
+
+
+def path(count):
+    graph = Graph()
+    graph.add_edges_from((i, i + 1) for i in range(count - 1))
+    return graph
+
+
+def tree(count, width=100):
+    graph = Graph()
+    graph.add_edges_from((i // width, i) for i in range(1, count))
+    return graph
+
+
+def run(engine, graph, repeat=1):
+    dfs = engine(graph)
+    start = perf_counter()
+    for _ in range(repeat):
+        dfs.parse(0)
+    return (perf_counter() - start) / repeat
+
+
+def report(name, graph, engines, repeat=1):
+    count = graph.count_of_nodes()
+    for engine in engines:
+        seconds = run(engine, graph, repeat)
+        print('{:<28} {:<26} {:>12,.0f} nodes/s'.format(
+            name, engine.__name__, count / seconds))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    both = (RecursiveDepthFirstSearch, DepthFirstSearch)
+    report('path of {:,}'.format(count), path(count), (DepthFirstSearch,))
+    report('path of 900', path(900), both, repeat=200)
+    report('tree of {:,}'.format(count), tree(count), both)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark the per-node cost of the depth first search signals.
+
+Compares a search without listeners, with slots for all signals and with
+overridden hooks against the former dispatch, that looked the signal up in
+a defaultdict on every call. Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/bench_signalslot.py [nodes]
+"""
+import sys
+from collections import defaultdict
+from time import perf_counter
+
+from jag import DepthFirstSearch
+from jag import Graph
+
+
+class LegacyDepthFirstSearch(DepthFirstSearch):
+    """Dispatch every event through the former signal implementation."""
+
+    def __init__(self, graph):
+        super().__init__(graph)
+        self._legacy = defaultdict(list)
+
+    def _legacy_signal(self, name, *args, **kwargs):
+        for method in self._legacy[name]:
+            method(*args, **kwargs)
+
+    def _entry(self, node):
+        self._legacy_signal('entry', node)
+
+    def _leaf(self, node):
+        self._legacy_signal('leaf', node)
+
+    def _exit(self, node):
+        self._legacy_signal('exit', node)
+
+
+class HookDepthFirstSearch(DepthFirstSearch):
+    """Override the hooks instead of registering slots."""
+
+    def _entry(self, node):
+        pass
+
+    def _leaf(self, node):
+        pass
+
+    def _exit(self, node):
+        pass
+
+
+def noop(node):
+    pass
+
+
+def tree(count, width=4):
+    graph = Graph()
+    graph.add_edges_from((i // width, i) for i in range(1, count))
+    return graph
+
+
+def run(dfs):
+    start = perf_counter()
+    dfs.parse(0)
+    return perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+    graph = tree(count)
+    cases = []
+    cases.append(('legacy, no slots', LegacyDepthFirstSearch(graph)))
+    dfs = LegacyDepthFirstSearch(graph)
+    for name in ('entry', 'leaf', 'exit'):
+        dfs._legacy[name].append(noop)
+    cases.append(('legacy, all slots', dfs))
+    cases.append(('no slots', DepthFirstSearch(graph)))
+    dfs = DepthFirstSearch(graph)
+    for name in ('entry', 'leaf', 'exit'):
+        dfs.slot(name, noop)
+    cases.append(('all slots', dfs))
+    cases.append(('overridden hooks', HookDepthFirstSearch(graph)))
+    for name, dfs in cases:
+        seconds = run(dfs)
+        print('{:<20} {:>8.0f} ns/node'.format(name, seconds / count * 1e9))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,2 +1,18 @@
 from jag.graph import Graph
+from jag.frozen import FrozenGraph
 from jag.dfs import DepthFirstSearch
+from jag.bfs import BreadthFirstSearch
+from jag.dag import dag_longest_path, dag_shortest_path
+from jag.euler import eulerian_cycle, eulerian_path, NotEulerian
+from jag.dijkstra import astar, bidirectional_dijkstra, dijkstra, dijkstra_path
+from jag.components import condensation, strongly_connected_components
+from jag.components import UnionFind, weakly_connected_components
+from jag.nonbranching import compact_nonbranching_paths
+from jag.nonbranching import maximal_nonbranching_paths
+from jag.formats import read_adjacency_list, read_edge_list
+from jag.formats import write_adjacency_list, write_edge_list
+from jag.debruijn import de_bruijn_graph, decode_kmer, encode_kmer
+from jag.parallel import map_components, map_roots
+from jag.parallel import parallel_strongly_connected_components
+from jag.topological import IncrementalTopologicalOrder
+from jag.reachability import ReachabilityIndex
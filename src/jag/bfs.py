@@ -0,0 +1,150 @@
+from jag.frozen import FrozenGraph
+from jag.graph import Graph
+from jag.signalslot import SignalSlot
+
+
+class BreadthFirstSearch(SignalSlot):
+    """This class executes a level synchronous breadth first search.
+
+    Each level (frontier) of the search is expanded as a batch with set
+    operations instead of a queue of single nodes. On a `FrozenGraph` the
+    search runs on the dense indices and the slices of the CSR arrays.
+
+    In direction optimizing mode the search switches from expanding the
+    frontier top-down to searching the parents of the unvisited nodes
+    bottom-up, when the frontier becomes large compared to the unexplored
+    rest of the graph. This pays off for low diameter graphs.
+
+    The class can be used in three ways:
+
+    1. By subclassing and implementing methods *level* and *visit* that are
+    called during the search.
+    2. By registering methods to slots that are triggered by the signals
+    *level* and *visit*.
+    3. By iterating the generator *levels* or reading *distances*.
+    """
+
+    """Switch to bottom-up if the frontier has more than 1 / ALPHA of the
+    unexplored edges."""
+    ALPHA = 14
+    """Switch back to top-down if the frontier has less than 1 / BETA of
+    the nodes."""
+    BETA = 24
+
+    def __init__(self, graph: Graph, direction_optimizing=False) -> None:
+        """Create a BreadthFirstSearch object.
+
+        :param graph: The graph to search, Graph or FrozenGraph.
+        :param direction_optimizing: Switch between top-down and bottom-up.
+        """
+        super().__init__()
+        self._graph = graph
+        self._direction_optimizing = direction_optimizing
+
+    def parse(self, root):
+        """Run the breadth first search from the given root node.
+
+        Calls the methods _level per frontier and _visit per node. Each of
+        this methods by default sends a signal of the same name. See:
+        SignalSlot.
+
+        :param root: ID of the start node.
+        :signal level: With depth and list of nodes of each frontier.
+        :signal visit: With node and depth of each node.
+        """
+        level, visit = map(self._hook, ('level', 'visit'))
+        for depth, frontier in enumerate(self.levels(root)):
+            if level is not None:
+                level(depth, frontier)
+            if visit is not None:
+                for node in frontier:
+                    visit(node, depth)
+
+    def levels(self, root):
+        """Generate the frontiers of the search.
+
+        The frontier of depth d holds the nodes d hops away from the root.
+        The order of the nodes within a frontier is undefined.
+
+        :param root: ID of the start node.
+        :return: Generator of lists of nodes.
+        """
+        graph = self._graph
+        if isinstance(graph, FrozenGraph):
+            ids = graph._ids
+            out_offsets, out_indices = graph._out_offsets, graph._out_indices
+            in_offsets, in_indices = graph._in_offsets, graph._in_indices
+
+            def successors(i):
+                return out_indices[out_offsets[i]:out_offsets[i + 1]]
+
+            def predecessors(i):
+                return in_indices[in_offsets[i]:in_offsets[i + 1]]
+
+            frontiers = self._levels(graph.index(root), successors,
+                                     predecessors, range(len(ids)),
+                                     len(out_indices))
+            for frontier in frontiers:
+                yield [ids[i] for i in frontier]
+        else:
+            if not graph.node_exists(root):
+                raise graph.NodeMissing('No node {}.'.format(root))
+            yield from self._levels(root, graph.successors, graph.predecessors,
+                                    graph.nodes, len(graph.edges))
+
+    def distances(self, root):
+        """Return the hop count from the root to each reachable node.
+
+        :param root: ID of the start node.
+        :return: Dict of node to depth.
+        """
+        return {node: depth
+                for depth, frontier in enumerate(self.levels(root))
+                for node in frontier}
+
+    def _levels(self, root, successors, predecessors, nodes, edges):
+        optimizing = self._direction_optimizing
+        visited = {root}
+        frontier = [root]
+        if optimizing:
+            unvisited = set(nodes)
+            unvisited.discard(root)
+            unexplored = edges - len(predecessors(root))
+            top_down = True
+        while frontier:
+            yield frontier
+            if optimizing:
+                if top_down:
+                    scout = sum(len(successors(node)) for node in frontier)
+                    top_down = scout <= unexplored / self.ALPHA
+                else:
+                    top_down = len(frontier) < len(nodes) / self.BETA
+            if not optimizing or top_down:
+                found = set().union(*map(successors, frontier))
+                found -= visited
+                frontier = list(found)
+            else:
+                parents = set(frontier)
+                frontier = [node for node in unvisited
+                            if not parents.isdisjoint(predecessors(node))]
+            visited.update(frontier)
+            if optimizing:
+                unvisited.difference_update(frontier)
+                unexplored -= sum(len(predecessors(node)) for node in frontier)
+
+    def _hook(self, name):
+        """Resolve the callable of an event, None if nobody listens.
+
+        See: DepthFirstSearch._hook
+        """
+        method = '_' + name
+        if (method in vars(self) or getattr(type(self), method)
+                is not getattr(BreadthFirstSearch, method)):
+            return getattr(self, method)
+        return self.dispatcher(name)
+
+    def _level(self, depth, frontier):
+        self.signal('level', depth, frontier)
+
+    def _visit(self, node, depth):
+        self.signal('visit', node, depth)
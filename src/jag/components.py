@@ -0,0 +1,300 @@
+from array import array
+
+from jag.frozen import FrozenGraph
+from jag.graph import Graph
+
+
+def _dense(graph):
+    """Map the graph to dense indices in the order of *graph.nodes*.
+
+    :return: Tuple of node ID list and successors function by index.
+    """
+    if isinstance(graph, FrozenGraph):
+        offsets, indices = graph._out_offsets, graph._out_indices
+
+        def successors(i):
+            return indices[offsets[i]:offsets[i + 1]]
+
+        return graph._ids, successors
+    ids = list(graph.nodes)
+    position = {id: i for i, id in enumerate(ids)}
+    tails = graph._tails
+
+    def successors(i):
+        return map(position.__getitem__, tails[ids[i]])
+
+    return ids, successors
+
+
+def strongly_connected_components(graph):
+    """Find the strongly connected components.
+
+    Iterative Tarjan's algorithm, linear in nodes and edges and without
+    recursion. The components are numbered in topological order of the
+    condensation, so edges between components always lead from a lower to
+    a higher number.
+
+    :param graph: The graph, Graph or FrozenGraph.
+    :return: Array of component numbers in the order of graph.nodes.
+    """
+    ids, successors = _dense(graph)
+    count = len(ids)
+    index = array('q', [-1]) * count
+    low = array('q', [0]) * count
+    component = array('q', [-1]) * count
+    on_stack = bytearray(count)
+    stack = []
+    counter = 0
+    components = 0
+    for root in range(count):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        nodes = [root]
+        children = [iter(successors(root))]
+        while children:
+            node = nodes[-1]
+            for child in children[-1]:
+                if index[child] == -1:
+                    index[child] = low[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack[child] = 1
+                    nodes.append(child)
+                    children.append(iter(successors(child)))
+                    break
+                elif on_stack[child] and index[child] < low[node]:
+                    low[node] = index[child]
+            else:
+                nodes.pop()
+                children.pop()
+                if nodes and low[node] < low[nodes[-1]]:
+                    low[nodes[-1]] = low[node]
+                if low[node] == index[node]:
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component[member] = components
+                        if member == node:
+                            break
+                    components += 1
+    # Tarjan finds the sinks first, reverse to topological order.
+    last = components - 1
+    for i in range(count):
+        component[i] = last - component[i]
+    return component
+
+
+def condensation(graph, components=None):
+    """Build the condensation of a graph.
+
+    Each strongly connected component becomes one node, numbered as by
+    *strongly_connected_components*. The node tag 'members' lists the
+    original nodes of the component. The result is a DAG.
+
+    :param graph: The graph, Graph or FrozenGraph.
+    :param components: Result of strongly_connected_components, if known.
+    :return: Graph
+    """
+    if components is None:
+        components = strongly_connected_components(graph)
+    ids, successors = _dense(graph)
+    condensed = Graph()
+    condensed.add_nodes_from(range(max(components, default=-1) + 1))
+    members = {}
+    for i, id in enumerate(ids):
+        members.setdefault(components[i], []).append(id)
+    edges = set()
+    for i in range(len(ids)):
+        tail = components[i]
+        for j in successors(i):
+            head = components[j]
+            if tail != head:
+                edges.add((tail, head))
+    condensed.add_edges_from(edges)
+    condensed.set_node_tags('members', members)
+    return condensed
+
+
+# noinspection PyShadowingBuiltins
+class UnionFind:
+    """Disjoint sets of nodes with path halving and union by rank.
+
+    The nodes are mapped to dense indices. Parents and ranks are kept in
+    arrays. Edges can be fed one by one as they stream in, without storing
+    any adjacency, or the structure can be attached to a `Graph` to follow
+    its creation signals.
+    """
+
+    def __init__(self, ids=()):
+        """Create the disjoint sets with a singleton set per given node.
+
+        :param ids: Iterable of node IDs.
+        """
+        """ID to index."""
+        self._index = {}
+        """Index to ID."""
+        self._ids = []
+        """Index to index of parent, roots are their own parent."""
+        self._parent = array('q')
+        """Index to rank, an upper bound of the height of the tree."""
+        self._rank = bytearray()
+        """Count of disjoint sets."""
+        self._count = 0
+        for id in ids:
+            self.add(id)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Create the disjoint sets of the weakly connected components.
+
+        :param graph: The graph, Graph or FrozenGraph.
+        :return: UnionFind
+        """
+        union_find = cls(graph.nodes)
+        union_find.add_edges_from(graph.iter_edges())
+        return union_find
+
+    def attach(self, graph: Graph):
+        """Follow a graph incrementally.
+
+        Adds the current nodes and edges of the graph and registers slots
+        for its signals *node_created* and *edge_created*.
+
+        :param graph: The graph to follow.
+        """
+        for id in graph.nodes:
+            self.add(id)
+        self.add_edges_from(graph.iter_edges())
+        graph.slot('node_created', self.add)
+        graph.slot('edge_created', self.union)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, id):
+        return id in self._index
+
+    def add(self, id):
+        """Add a node as a singleton set.
+
+        :param id: ID of node.
+        :return: False if the node already exists, else True.
+        """
+        if id in self._index:
+            return False
+        i = len(self._ids)
+        self._index[id] = i
+        self._ids.append(id)
+        self._parent.append(i)
+        self._rank.append(0)
+        self._count += 1
+        return True
+
+    def _find(self, i):
+        parent = self._parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def find(self, id):
+        """Return the representative node of the set of a node.
+
+        Raises KeyError if the node is unknown.
+
+        :param id: ID of node.
+        :return: ID of the representative.
+        """
+        return self._ids[self._find(self._index[id])]
+
+    def union(self, a, b):
+        """Merge the sets of two nodes, adding the nodes as necessary.
+
+        This is also the way to feed an edge (a, b).
+
+        :param a: ID of node.
+        :param b: ID of node.
+        :return: True if two sets were merged, else False.
+        """
+        index = self._index
+        if a not in index:
+            self.add(a)
+        if b not in index:
+            self.add(b)
+        i, j = self._find(index[a]), self._find(index[b])
+        if i == j:
+            return False
+        rank = self._rank
+        if rank[i] < rank[j]:
+            i, j = j, i
+        self._parent[j] = i
+        if rank[i] == rank[j]:
+            rank[i] += 1
+        self._count -= 1
+        return True
+
+    def add_edges_from(self, edges):
+        """Merge the sets of the nodes of many edges.
+
+        :param edges: Iterable of (tail, head) pairs.
+        """
+        union = self.union
+        for a, b in edges:
+            union(a, b)
+
+    def connected(self, a, b):
+        """Check if two nodes are in the same set.
+
+        Raises KeyError if a node is unknown.
+
+        :param a: ID of node.
+        :param b: ID of node.
+        :return: Boolean.
+        """
+        index = self._index
+        return self._find(index[a]) == self._find(index[b])
+
+    def count_of_components(self):
+        """Return the count of disjoint sets.
+
+        :return: Count of sets.
+        """
+        return self._count
+
+    def labels(self):
+        """Number the sets in order of their first node.
+
+        :return: Array of set numbers in order of the nodes as added.
+        """
+        numbers = {}
+        labels = array('q')
+        for i in range(len(self._ids)):
+            labels.append(numbers.setdefault(self._find(i), len(numbers)))
+        return labels
+
+    def components(self):
+        """Return the sets in order of their first node.
+
+        :return: List of lists of node IDs.
+        """
+        groups = {}
+        ids = self._ids
+        for i in range(len(ids)):
+            groups.setdefault(self._find(i), []).append(ids[i])
+        return list(groups.values())
+
+
+def weakly_connected_components(graph):
+    """Find the weakly connected components.
+
+    Union-find over the edges, nearly linear in nodes and edges. The
+    components are numbered in order of their first node.
+
+    :param graph: The graph, Graph or FrozenGraph.
+    :return: Array of component numbers in the order of graph.nodes.
+    """
+    return UnionFind.from_graph(graph).labels()
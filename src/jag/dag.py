@@ -0,0 +1,94 @@
+from math import inf
+
+from jag.graph import Graph
+
+
+def _weight(graph: Graph, weight_tag, default):
+    """Return a function to read the weight of an edge."""
+    get = graph.get_edge_tags(weight_tag).get
+
+    def weight(tail, head):
+        return get((tail, head), default)
+
+    return weight
+
+
+def _backtrack(predecessor, node):
+    path = [node]
+    while node in predecessor:
+        node = predecessor[node]
+        path.append(node)
+    path.reverse()
+    return path
+
+
+def dag_longest_path(graph: Graph, weight_tag='weight', default=1):
+    """Find the longest path of a directed acyclic graph.
+
+    Relaxes the edges in topological order in a single pass, linear in nodes
+    and edges. The weights are read from the edge tags, edges without the
+    tag weigh *default*.
+
+    Raises Graph.CycleInDAG if the graph has a cycle.
+
+    :param graph: The graph.
+    :param weight_tag: Name of the edge tag holding the weight.
+    :param default: Weight of edges without the tag.
+    :return: Tuple of length and list of nodes.
+    """
+    weight = _weight(graph, weight_tag, default)
+    distance = {}
+    predecessor = {}
+    end, longest = None, -inf
+    for tail in graph.topological_order():
+        length = distance.get(tail, 0)
+        if length > longest:
+            end, longest = tail, length
+        for head in graph.successors(tail):
+            candidate = length + weight(tail, head)
+            if candidate > distance.get(head, 0):
+                distance[head] = candidate
+                predecessor[head] = tail
+    if end is None:
+        return 0, []
+    return longest, _backtrack(predecessor, end)
+
+
+def dag_shortest_path(graph: Graph, source, target, weight_tag='weight',
+                      default=1):
+    """Find the shortest path between two nodes of a directed acyclic graph.
+
+    Relaxes the edges in topological order in a single pass, linear in nodes
+    and edges. Negative weights are allowed. The weights are read from the
+    edge tags, edges without the tag weigh *default*.
+
+    Raises Graph.CycleInDAG if the graph has a cycle.
+    Raises Graph.NodeMissing if source or target do not exist.
+
+    :param graph: The graph.
+    :param source: ID of the start node.
+    :param target: ID of the end node.
+    :param weight_tag: Name of the edge tag holding the weight.
+    :param default: Weight of edges without the tag.
+    :return: Tuple of length and list of nodes, (inf, []) if unreachable.
+    """
+    for id in (source, target):
+        if not graph.node_exists(id):
+            raise graph.NodeMissing('No node {}.'.format(id))
+    weight = _weight(graph, weight_tag, default)
+    distance = {source: 0}
+    predecessor = {}
+    for tail in graph.topological_order():
+        if tail == target:
+            break
+        if tail not in distance:
+            continue
+        length = distance[tail]
+        for head in graph.successors(tail):
+            candidate = length + weight(tail, head)
+            if candidate < distance.get(head, inf):
+                distance[head] = candidate
+                predecessor[head] = tail
+    if target not in distance:
+        return inf, []
+    return distance[target], _backtrack(predecessor, target)
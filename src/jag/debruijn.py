@@ -0,0 +1,100 @@
+import re
+
+from jag.graph import Graph
+
+"""Bases to characters of their 2 bit values."""
+VALUES = str.maketrans('ACGTacgt', '\x00\x01\x02\x03' * 2)
+BASES = 'ACGT'
+"""Count of edges inserted into the graph at once."""
+CHUNK_SIZE = 1 << 18
+
+_runs = re.compile('[ACGTacgt]+').findall
+
+
+def encode_kmer(kmer):
+    """Encode a k-mer of the bases ACGT as integer of 2 bits per base.
+
+    Raises ValueError for other characters.
+
+    :param kmer: String of bases.
+    :return: Integer code.
+    """
+    if not kmer or _runs(kmer) != [kmer]:
+        raise ValueError('No k-mer: {}.'.format(kmer))
+    code = 0
+    for value in _values(kmer):
+        code = code << 2 | value
+    return code
+
+
+def _values(bases):
+    """Return the 2 bit values of a string of bases as bytes."""
+    return bases.translate(VALUES).encode('ascii')
+
+
+def decode_kmer(code, k):
+    """Decode the integer code of a k-mer.
+
+    :param code: Integer code, see *encode_kmer*.
+    :param k: Length of the k-mer.
+    :return: String of bases.
+    """
+    bases = []
+    for _ in range(k):
+        bases.append(BASES[code & 3])
+        code >>= 2
+    return ''.join(reversed(bases))
+
+
+def _edges(reads, k):
+    """Generate the edges of (k-1)-mer codes, one per k-mer of the reads."""
+    length = k - 1
+    mask = (1 << 2 * length) - 1
+    for read in reads:
+        for run in _runs(read):
+            if len(run) < k:
+                continue
+            values = _values(run)
+            tail = 0
+            for value in values[:length]:
+                tail = tail << 2 | value
+            for value in values[length:]:
+                head = (tail << 2 | value) & mask
+                yield tail, head
+                tail = head
+
+
+def de_bruijn_graph(reads, k, graph=None, chunk_size=CHUNK_SIZE):
+    """Build the de Bruijn graph of the k-mers of reads in one pass.
+
+    Each k-mer becomes an edge from its prefix to its suffix (k-1)-mer.
+    The (k-1)-mers are 2 bit encoded as integer node IDs with a rolling
+    code, so no string is sliced per k-mer and each step is O(1). Decode
+    them with *decode_kmer*. K-mers are given as reads of length k.
+    Characters other than ACGT split a read, k-mers spanning them are
+    skipped.
+
+    The reads are streamed. The edges are inserted in chunks of
+    *chunk_size* with `Graph.add_edges_from`, which counts the
+    multiplicities of repeated k-mers in a multigraph. The memory is
+    bounded by the graph and one chunk. For k up to 32 the IDs fit into
+    64 bits, as needed by `FrozenGraph.save`.
+
+    :param reads: Iterable of strings of bases.
+    :param k: Length of the k-mers, at least 2.
+    :param graph: Graph to add to. A new multigraph if not given.
+    :param chunk_size: Count of edges inserted at once.
+    :return: The graph.
+    """
+    if k < 2:
+        raise ValueError('No k-mer length: {}.'.format(k))
+    if graph is None:
+        graph = Graph(multigraph=True)
+    chunk = []
+    for edge in _edges(reads, k):
+        chunk.append(edge)
+        if len(chunk) >= chunk_size:
+            graph.add_edges_from(chunk)
+            chunk.clear()
+    graph.add_edges_from(chunk)
+    return graph
@@ -1,3 +1,5 @@
+from collections import deque
+
 from jag import Graph
 from jag.signalslot import SignalSlot
 
@@ -5,37 +7,51 @@ from jag.signalslot import SignalSlot
 class DepthFirstSearch(SignalSlot):
     """This class executes a depth first search on a given graph.
     
-    The class can be used in two ways:
+    The class can be used in three ways:
     
     1. By subclassing and implementing methods *entry*, *leaf*, *exit* that 
     are called during the visit of the nodes. 
     2. By registering methods to slots that are triggered during the visit of 
     the nodes by the signals *entry*, *leaf* or *exit*. 
+    3. By iterating the generators *events*, *preorder*, *postorder* or
+    *leaves*.
     """
 
-    # noinspection PyClassHasNoInit
-    class CycleInDAG(Exception):
-        pass
+    class CycleInDAG(Graph.CycleInDAG):
+        def __init__(self, message, cycle=()):
+            super().__init__(message)
+            self.cycle = list(cycle)
 
-    def __init__(self, graph: Graph) -> None:
+    def __init__(self, graph: Graph, revisit=False) -> None:
         """Create a DepthFirstSearch object.
+
+        By default each node is visited once, even if it is shared by
+        multiple parents as in a DAG. With `revisit` set, shared nodes are
+        entered again from each parent, like the nodes of a tree.
         
         :param graph: The graph to parse. 
+        :param revisit: Re-enter shared nodes.
         """
         super().__init__()
         self._graph = graph
+        self._revisit = revisit
 
     def parse(self, root):
         """Run the depth first search from the given root node.
 
-        Walks recursively through the tree. Calls the methods _entry, _leaf, 
-        _exit. 
+        Walks iteratively through the tree, so there is no recursion limit
+        to the depth. Calls the methods _entry, _leaf, _exit. 
         
         Each of this methods by default sends a signal of the same name. This 
         signals trigger the notification of methods that may be registered 
         into slots by the names of the signals. See: _SignalSlot.
 
-        Raises CycleInDAG error in case of a cycle.
+        Nodes are colored white (unseen), gray (on the current path) and
+        black (finished). Only an edge back to a gray node is a cycle. Black
+        nodes are skipped, unless revisiting is enabled.
+
+        Raises CycleInDAG error in case of a cycle. The attribute *cycle* of
+        the error holds the path from the repeated node back to itself.
 
         :param root: ID of current node.
         :signal entry: On entering the node.
@@ -44,18 +60,129 @@ class DepthFirstSearch(SignalSlot):
         """
         self._dfs(root, set())
 
-    def _dfs(self, node, seen: set):
-        if node in seen:
-            msg = 'Unexpected cycle detected at node {}.'.format(node)
-            raise self.CycleInDAG(msg)
-        self._entry(node)
-        seen.add(node)
-        if len(self._graph.successors(node)) == 0:
-            self._leaf(node)
-        else:
-            for child in self._graph.successors(node):
-                self._dfs(child, seen)
-        self._exit(node)
+    def _dfs(self, root, seen: set):
+        """Run the walk and call the hooks of its events.
+
+        The hooks are resolved once before the walk, see *_hook*. The walk
+        is drained at C level, its steps yield nothing of interest here.
+        """
+        hooks = map(self._hook, ('entry', 'leaf', 'exit'))
+        deque(self._walk(root, seen, *hooks), maxlen=0)
+
+    def _walk(self, root, seen: set, entry, leaf, exit):
+        """Iterative depth first search with an explicit stack.
+
+        The stack holds the iterators over the children of the open nodes,
+        so the Python stack stays flat for paths of any length. The open
+        (gray) nodes are kept in a parallel list to avoid a tuple per frame
+        and in a set for the cycle check. Finished (black) nodes go to
+        *seen*. Leaves are handled in place without pushing a frame.
+
+        The hooks entry, leaf and exit are called with the node, hooks that
+        are None are skipped. The generator yields after each push and pop
+        of a frame, so a consumer can interleave with the walk.
+        """
+        successors = self._graph.successors
+        revisit = self._revisit
+        gray = set()
+        nodes = [None]
+        stack = [iter((root,))]
+        while stack:
+            for child in stack[-1]:
+                if child in gray:
+                    raise self._cycle(nodes, child)
+                if child in seen:
+                    continue
+                if entry is not None:
+                    entry(child)
+                grandchildren = successors(child)
+                if len(grandchildren) == 0:
+                    if leaf is not None:
+                        leaf(child)
+                    if not revisit:
+                        seen.add(child)
+                    if exit is not None:
+                        exit(child)
+                else:
+                    gray.add(child)
+                    nodes.append(child)
+                    stack.append(iter(grandchildren))
+                    break
+            else:
+                stack.pop()
+                node = nodes.pop()
+                if stack:
+                    gray.discard(node)
+                    if not revisit:
+                        seen.add(node)
+                    if exit is not None:
+                        exit(node)
+            yield
+
+    def events(self, root):
+        """Generate the events of the depth first search lazily.
+
+        Yields the same events in the same order as *parse* signals them,
+        as pairs of kind ('entry', 'leaf' or 'exit') and node. No callbacks
+        are involved, the walk advances as the pairs are consumed and stops
+        when the consumer stops.
+
+        Raises CycleInDAG error in case of a cycle.
+
+        :param root: ID of the start node.
+        :return: Generator of (kind, node) pairs.
+        """
+        buffer = []
+        append = buffer.append
+        hooks = (lambda node: append(('entry', node)),
+                 lambda node: append(('leaf', node)),
+                 lambda node: append(('exit', node)))
+        for _ in self._walk(root, set(), *hooks):
+            yield from buffer
+            buffer.clear()
+
+    def preorder(self, root):
+        """Generate the nodes in order of entry.
+
+        :param root: ID of the start node.
+        :return: Generator of nodes.
+        """
+        return (node for kind, node in self.events(root) if kind == 'entry')
+
+    def postorder(self, root):
+        """Generate the nodes in order of exit.
+
+        :param root: ID of the start node.
+        :return: Generator of nodes.
+        """
+        return (node for kind, node in self.events(root) if kind == 'exit')
+
+    def leaves(self, root):
+        """Generate the leaves in order of visit.
+
+        :param root: ID of the start node.
+        :return: Generator of nodes.
+        """
+        return (node for kind, node in self.events(root) if kind == 'leaf')
+
+    def _hook(self, name):
+        """Resolve the callable of an event, None if nobody listens.
+
+        An overridden hook method is called as it is. The default hook only
+        sends the signal of the same name, so its slots are called directly,
+        skipping the dispatch if there are none.
+        """
+        method = '_' + name
+        if (method in vars(self) or getattr(type(self), method)
+                is not getattr(DepthFirstSearch, method)):
+            return getattr(self, method)
+        return self.dispatcher(name)
+
+    def _cycle(self, nodes, node):
+        cycle = nodes[nodes.index(node):] + [node]
+        msg = 'Unexpected cycle detected at node {}: {}.'.format(
+            node, ' -> '.join(map(str, cycle)))
+        return self.CycleInDAG(msg, cycle)
 
     def _entry(self, node):
         self.signal('entry', node)
@@ -0,0 +1,204 @@
+from heapq import heappop, heappush
+from itertools import count
+from math import inf
+
+from jag.dag import _backtrack
+from jag.graph import Graph
+
+
+def _weights(graph: Graph, weight_tag, default):
+    """Return the getter of the weight of an edge.
+
+    The weights are checked as they are read, so a search that stops early
+    does not pay for the whole column. Raises ValueError for a negative
+    weight read.
+    """
+    get = graph.get_edge_tags(weight_tag).get
+    if default < 0:
+        raise ValueError('Negative weight in tag {}.'.format(weight_tag))
+
+    def weight(edge):
+        value = get(edge, default)
+        if value < 0:
+            raise ValueError('Negative weight in tag {}.'.format(weight_tag))
+        return value
+
+    return weight
+
+
+def _check(graph: Graph, *ids):
+    for id in ids:
+        if not graph.node_exists(id):
+            raise graph.NodeMissing('No node {}.'.format(id))
+
+
+def dijkstra(graph: Graph, source, targets=None, weight_tag='weight',
+             default=1):
+    """Find the shortest distances from a source node.
+
+    Dijkstra's algorithm with a binary heap. The weights are read from the
+    edge tags, edges without the tag weigh *default*. If *targets* are
+    given, the search stops as soon as all of them are settled.
+
+    Raises Graph.NodeMissing if the source does not exist.
+    Raises ValueError for negative weights of the edges searched.
+
+    :param graph: The graph, Graph or FrozenGraph.
+    :param source: ID of the start node.
+    :param targets: Iterable of node ID's to stop at, if any.
+    :param weight_tag: Name of the edge tag holding the weight.
+    :param default: Weight of edges without the tag.
+    :return: Tuple of dicts of node to distance and node to predecessor.
+    """
+    _check(graph, source)
+    weight = _weights(graph, weight_tag, default)
+    successors = graph.successors
+    pending = None if targets is None else set(targets)
+    distance = {source: 0}
+    predecessor = {}
+    settled = set()
+    order = count(1)
+    heap = [(0, 0, source)]
+    while heap:
+        length, _, tail = heappop(heap)
+        if tail in settled:
+            continue
+        settled.add(tail)
+        if pending is not None:
+            pending.discard(tail)
+            if not pending:
+                break
+        for head in successors(tail):
+            candidate = length + weight((tail, head))
+            if candidate < distance.get(head, inf):
+                distance[head] = candidate
+                predecessor[head] = tail
+                heappush(heap, (candidate, next(order), head))
+    if pending is not None:
+        distance = {id: distance[id] for id in settled}
+        predecessor = {id: tail for id, tail in predecessor.items()
+                       if id in settled}
+    return distance, predecessor
+
+
+def dijkstra_path(graph: Graph, source, target, weight_tag='weight',
+                  default=1):
+    """Find the shortest path between two nodes with Dijkstra's algorithm.
+
+    Stops as soon as the target is settled. See: dijkstra
+
+    :param graph: The graph, Graph or FrozenGraph.
+    :param source: ID of the start node.
+    :param target: ID of the end node.
+    :param weight_tag: Name of the edge tag holding the weight.
+    :param default: Weight of edges without the tag.
+    :return: Tuple of length and list of nodes, (inf, []) if unreachable.
+    """
+    _check(graph, target)
+    distance, predecessor = dijkstra(graph, source, (target,), weight_tag,
+                                     default)
+    if target not in distance:
+        return inf, []
+    return distance[target], _backtrack(predecessor, target)
+
+
+def bidirectional_dijkstra(graph: Graph, source, target, weight_tag='weight',
+                           default=1):
+    """Find the shortest path between two nodes searching from both ends.
+
+    Runs Dijkstra's algorithm forward from the source and backward from the
+    target, always advancing the side with the closer frontier, until the
+    frontiers prove the best meeting point. This typically settles far
+    fewer nodes than a single search.
+
+    Raises Graph.NodeMissing if source or target do not exist.
+    Raises ValueError for negative weights of the edges searched.
+
+    :param graph: The graph, Graph or FrozenGraph.
+    :param source: ID of the start node.
+    :param target: ID of the end node.
+    :param weight_tag: Name of the edge tag holding the weight.
+    :param default: Weight of edges without the tag.
+    :return: Tuple of length and list of nodes, (inf, []) if unreachable.
+    """
+    _check(graph, source, target)
+    weight = _weights(graph, weight_tag, default)
+    if source == target:
+        return 0, [source]
+    neighbours = (graph.successors, graph.predecessors)
+    distances = ({source: 0}, {target: 0})
+    predecessors = ({}, {})
+    settled = (set(), set())
+    heaps = ([(0, 0, source)], [(0, 0, target)])
+    order = count(1)
+    best, meeting = inf, None
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        length, _, node = heappop(heaps[side])
+        if node in settled[side]:
+            continue
+        settled[side].add(node)
+        distance, other = distances[side], distances[1 - side]
+        for neighbour in neighbours[side](node):
+            edge = (node, neighbour) if side == 0 else (neighbour, node)
+            candidate = length + weight(edge)
+            if candidate < distance.get(neighbour, inf):
+                distance[neighbour] = candidate
+                predecessors[side][neighbour] = node
+                heappush(heaps[side], (candidate, next(order), neighbour))
+            if neighbour in other:
+                total = distance[neighbour] + other[neighbour]
+                if total < best:
+                    best, meeting = total, neighbour
+    if meeting is None:
+        return inf, []
+    path = _backtrack(predecessors[0], meeting)
+    path.extend(reversed(_backtrack(predecessors[1], meeting)[:-1]))
+    return best, path
+
+
+def astar(graph: Graph, source, target, heuristic, weight_tag='weight',
+          default=1):
+    """Find the shortest path between two nodes with A*.
+
+    Like Dijkstra's algorithm, but the heap is ordered by the distance plus
+    the estimated rest to the target. The heuristic must not overestimate
+    and be consistent for the result to be optimal.
+
+    Raises Graph.NodeMissing if source or target do not exist.
+    Raises ValueError for negative weights of the edges searched.
+
+    :param graph: The graph, Graph or FrozenGraph.
+    :param source: ID of the start node.
+    :param target: ID of the end node.
+    :param heuristic: Function of node and target to the estimated rest.
+    :param weight_tag: Name of the edge tag holding the weight.
+    :param default: Weight of edges without the tag.
+    :return: Tuple of length and list of nodes, (inf, []) if unreachable.
+    """
+    _check(graph, source, target)
+    weight = _weights(graph, weight_tag, default)
+    successors = graph.successors
+    distance = {source: 0}
+    predecessor = {}
+    settled = set()
+    order = count(1)
+    heap = [(heuristic(source, target), 0, source)]
+    while heap:
+        _, _, tail = heappop(heap)
+        if tail == target:
+            return distance[tail], _backtrack(predecessor, tail)
+        if tail in settled:
+            continue
+        settled.add(tail)
+        length = distance[tail]
+        for head in successors(tail):
+            candidate = length + weight((tail, head))
+            if candidate < distance.get(head, inf):
+                distance[head] = candidate
+                predecessor[head] = tail
+                estimate = candidate + heuristic(head, target)
+                heappush(heap, (estimate, next(order), head))
+    return inf, []
@@ -0,0 +1,121 @@
+from jag.graph import Graph
+
+
+class NotEulerian(Graph.Error):
+    pass
+
+
+def _multiplicities(graph, tag):
+    """Map edges to their multiplicity, where it is not 1."""
+    if tag is None:
+        return graph._multiplicity
+    column = graph.get_edge_tags(tag)
+    return {edge: count for edge, count in column.items() if count != 1}
+
+
+def _balance(graph, multiplicities):
+    """Return out-degree minus in-degree by node and the count of edges."""
+    balance = dict.fromkeys(graph.nodes, 0)
+    total = 0
+    for edge in graph.edges:
+        count = multiplicities.get(edge, 1)
+        balance[edge[0]] += count
+        balance[edge[1]] -= count
+        total += count
+    return balance, total
+
+
+def _hierholzer(graph, end, total, multiplicities):
+    """Walk Hierholzer's algorithm backwards, from the end of the path.
+
+    Following the predecessors, the nodes are popped from the stack in
+    forward order of the path, so they can be yielded as they come.
+    """
+    pending = {id: list(graph.predecessors(id)) for id in graph.nodes}
+    multiplicities = dict(multiplicities)
+    count = 0
+    stack = [end]
+    while stack:
+        head = stack[-1]
+        tails = pending[head]
+        if tails:
+            tail = tails[-1]
+            edge = (tail, head)
+            left = multiplicities.get(edge, 1) - 1
+            if left > 0:
+                multiplicities[edge] = left
+            else:
+                tails.pop()
+            stack.append(tail)
+        else:
+            stack.pop()
+            count += 1
+            yield head
+    if count != total + 1:
+        raise NotEulerian('The edges are not connected, {} of {} edges '
+                          'walked.'.format(count - 1, total))
+
+
+def eulerian_path(graph, multiplicity_tag=None):
+    """Generate the nodes of an Eulerian path.
+
+    Iterative Hierholzer's algorithm, linear in nodes and edges. The nodes
+    are yielded as the path is found, so the path is never materialized as
+    a whole. If all nodes are balanced, the path is an Eulerian cycle.
+
+    Works on `Graph` and `FrozenGraph`. Edges are traversed as often as
+    their multiplicity in a multigraph, or as given by the integer edge tag
+    *multiplicity_tag*.
+
+    Raises NotEulerian if the degrees are not balanced for a path, before
+    the first node is yielded. Raises NotEulerian at the end, if the edges
+    are not connected.
+
+    :param graph: The graph.
+    :param multiplicity_tag: Edge tag holding multiplicities, if any.
+    :return: Generator of node ID's.
+    """
+    multiplicities = _multiplicities(graph, multiplicity_tag)
+    balance, total = _balance(graph, multiplicities)
+    starts = [id for id, value in balance.items() if value == 1]
+    ends = [id for id, value in balance.items() if value == -1]
+    unbalanced = sum(1 for value in balance.values() if value != 0)
+    if len(starts) == len(ends) == 1 and unbalanced == 2:
+        end = ends[0]
+    elif unbalanced == 0:
+        end = next((id for id in graph.nodes if graph.predecessors(id)), None)
+        if end is None:
+            return
+    else:
+        raise NotEulerian('No Eulerian path, {} nodes are '
+                          'unbalanced.'.format(unbalanced))
+    yield from _hierholzer(graph, end, total, multiplicities)
+
+
+def eulerian_cycle(graph, start=None, multiplicity_tag=None):
+    """Generate the nodes of an Eulerian cycle.
+
+    Like *eulerian_path*, but all nodes must be balanced. The cycle begins
+    and ends at *start* or, if not given, at a node with edges.
+
+    Raises NotEulerian if the graph has no Eulerian cycle.
+
+    :param graph: The graph.
+    :param start: ID of the node to begin and end with.
+    :param multiplicity_tag: Edge tag holding multiplicities, if any.
+    :return: Generator of node ID's.
+    """
+    multiplicities = _multiplicities(graph, multiplicity_tag)
+    balance, total = _balance(graph, multiplicities)
+    unbalanced = sum(1 for value in balance.values() if value != 0)
+    if unbalanced:
+        raise NotEulerian('No Eulerian cycle, {} nodes are '
+                          'unbalanced.'.format(unbalanced))
+    if start is None:
+        start = next((id for id in graph.nodes if graph.predecessors(id)),
+                     None)
+        if start is None:
+            return
+    elif not graph.predecessors(start):
+        raise NotEulerian('No edges at node {}.'.format(start))
+    yield from _hierholzer(graph, start, total, multiplicities)
@@ -0,0 +1,178 @@
+import gzip
+from os import PathLike
+
+from jag.graph import Graph
+
+"""Size hint in characters of the chunks read and written at once."""
+CHUNK_SIZE = 1 << 20
+
+
+def _open(source, mode):
+    """Open a path as text file, gzip compressed if it ends with '.gz'.
+
+    File objects are passed through, they are neither opened nor closed.
+
+    :return: Tuple of file object and whether to close it.
+    """
+    if isinstance(source, (str, PathLike)):
+        if str(source).endswith('.gz'):
+            return gzip.open(source, mode + 't', encoding='utf-8'), True
+        return open(source, mode, encoding='utf-8'), True
+    return source, False
+
+
+def _chunks(source, chunk_size):
+    """Generate the lines of a file in lists of about *chunk_size* chars."""
+    file, close = _open(source, 'r')
+    try:
+        while True:
+            lines = file.readlines(chunk_size)
+            if not lines:
+                break
+            yield lines
+    finally:
+        if close:
+            file.close()
+
+
+def _load(graph, source, parse, convert, chunk_size):
+    if graph is None:
+        graph = Graph()
+    for lines in _chunks(source, chunk_size):
+        nodes, edges = [], []
+        for line in lines:
+            parse(line, nodes, edges)
+        if convert is not None:
+            nodes = list(map(convert, nodes))
+            edges = [(convert(tail), convert(head)) for tail, head in edges]
+        graph.add_nodes_from(nodes)
+        graph.add_edges_from(edges)
+    return graph
+
+
+def read_edge_list(source, graph=None, separator=None, convert=None,
+                   chunk_size=CHUNK_SIZE):
+    """Read an edge list, one edge of tail and head per line.
+
+    The file is streamed in chunks of lines, each chunk is inserted with
+    `Graph.add_edges_from`. A line with a single field is a node without
+    edges. Empty lines and lines starting with '#' are skipped.
+
+    :param source: Path or text file object. Paths ending in '.gz' are
+        decompressed.
+    :param graph: Graph to add to. A new `Graph` if not given.
+    :param separator: Separator of tail and head, by default whitespace.
+    :param convert: Function to convert the ID strings, e.g. int.
+    :param chunk_size: Size hint of the chunks in characters.
+    :return: The graph.
+    """
+
+    def parse(line, nodes, edges):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            return
+        fields = line.split(separator)
+        if len(fields) == 2:
+            edges.append((fields[0].strip(), fields[1].strip()))
+        elif len(fields) == 1:
+            nodes.append(line)
+        else:
+            raise ValueError('No edge: {!r}.'.format(line))
+
+    return _load(graph, source, parse, convert, chunk_size)
+
+
+def read_adjacency_list(source, graph=None, convert=None,
+                        chunk_size=CHUNK_SIZE):
+    """Read an adjacency list, a tail and its heads per line.
+
+    The format is the one of Rosalind: `A -> B,C`. A line without arrow or
+    without heads is a node without outgoing edges. Repeated heads are
+    repeated edges of a multigraph. Empty lines and lines starting with '#'
+    are skipped. The file is streamed in chunks like by *read_edge_list*.
+
+    :param source: Path or text file object. Paths ending in '.gz' are
+        decompressed.
+    :param graph: Graph to add to. A new `Graph` if not given.
+    :param convert: Function to convert the ID strings, e.g. int.
+    :param chunk_size: Size hint of the chunks in characters.
+    :return: The graph.
+    """
+
+    def parse(line, nodes, edges):
+        tail, _, heads = line.partition('->')
+        tail = tail.strip()
+        if not tail or tail.startswith('#'):
+            return
+        heads = [head.strip() for head in heads.split(',') if head.strip()]
+        if not heads:
+            nodes.append(tail)
+            return
+        edges.extend((tail, head) for head in heads)
+
+    return _load(graph, source, parse, convert, chunk_size)
+
+
+def _dump(target, lines, chunk_size):
+    file, close = _open(target, 'w')
+    try:
+        chunk, size = [], 0
+        for line in lines:
+            chunk.append(line)
+            size += len(line)
+            if size >= chunk_size:
+                file.write(''.join(chunk))
+                chunk, size = [], 0
+        file.write(''.join(chunk))
+    finally:
+        if close:
+            file.close()
+
+
+def write_edge_list(graph: Graph, target, separator=' ',
+                    chunk_size=CHUNK_SIZE):
+    """Write an edge list, one edge of tail and head per line.
+
+    Edges of a multigraph are repeated by their multiplicity, nodes without
+    edges are written as single field. The lines are joined and written in
+    chunks.
+
+    :param graph: The graph, Graph or FrozenGraph.
+    :param target: Path or text file object. Paths ending in '.gz' are
+        compressed.
+    :param separator: Separator of tail and head.
+    :param chunk_size: Size hint of the chunks in characters.
+    """
+    def lines():
+        template = '{}' + separator + '{}\n'
+        for node in graph.nodes:
+            edges = graph.outgoing(node)
+            if not edges and not graph.predecessors(node):
+                yield '{}\n'.format(node)
+            for tail, head in edges:
+                yield template.format(tail, head)
+
+    _dump(target, lines(), chunk_size)
+
+
+def write_adjacency_list(graph: Graph, target, chunk_size=CHUNK_SIZE):
+    """Write an adjacency list, a tail and its heads per line: `A -> B,C`.
+
+    Heads of a multigraph are repeated by their multiplicity, nodes without
+    outgoing edges are written without arrow. The lines are joined and
+    written in chunks.
+
+    :param graph: The graph, Graph or FrozenGraph.
+    :param target: Path or text file object. Paths ending in '.gz' are
+        compressed.
+    :param chunk_size: Size hint of the chunks in characters.
+    """
+    def lines():
+        for node in graph.nodes:
+            heads = [str(head) for _, head in graph.outgoing(node)]
+            if heads:
+                yield '{} -> {}\n'.format(node, ','.join(heads))
+            else:
+                yield '{}\n'.format(node)
+
+    _dump(target, lines(), chunk_size)
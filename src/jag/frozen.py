@@ -0,0 +1,564 @@
+import mmap
+import pickle
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Set
+from operator import sub
+from types import MappingProxyType
+
+from jag.graph import Graph
+
+
+"""Snapshot header: magic, version, kind of ID table, count of nodes, count
+of edges, byte length of ID table. All integers are little endian."""
+HEADER = struct.Struct('<4sHHQQQ')
+MAGIC = b'JAG\x00'
+VERSION = 2
+"""Kinds of ID table."""
+PICKLED_IDS = 0
+INTEGER_IDS = 1
+
+
+def _padding(length):
+    return -length % 8
+
+
+class EdgesView(Set):
+    """Live view of all edges of a FrozenGraph.
+
+    Length is O(1), membership a binary search, iteration lazy.
+    """
+
+    __slots__ = ('_graph',)
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        return set(iterable)
+
+    def __len__(self):
+        return len(self._graph._out_indices)
+
+    def __contains__(self, edge):
+        try:
+            tail, head = edge
+        except (TypeError, ValueError):
+            return False
+        return self._graph.edge_exists(tail, head)
+
+    def __iter__(self):
+        return self._graph.iter_edges()
+
+
+# noinspection PyShadowingBuiltins
+class FrozenGraph:
+    """A read-only graph in compressed sparse row (CSR) layout.
+
+    The node IDs are mapped to dense integer indices. Outgoing and incoming
+    edges are stored in contiguous offset and index arrays, sorted by index
+    within each node. Compared to `Graph` this takes a small fraction of the
+    memory per edge and iterating the neighbours of a node reads a
+    contiguous slice of an array.
+
+    The query interface matches the one of `Graph`. Typically the object is
+    created by `Graph.freeze`.
+    """
+
+    Error = Graph.Error
+    NodeMissing = Graph.NodeMissing
+    EdgeMissing = Graph.EdgeMissing
+    NodeTagMissing = Graph.NodeTagMissing
+    EdgeTagMissing = Graph.EdgeTagMissing
+    CycleInDAG = Graph.CycleInDAG
+
+    def __init__(self, ids, out_offsets, out_indices, in_offsets, in_indices,
+                 node_tags=None, edge_tags=None, multiplicity=None,
+                 multigraph=False):
+        """Create a frozen graph from its CSR arrays.
+
+        :param ids: Sequence of node IDs, the position is the dense index.
+        :param out_offsets: Offsets into out_indices, one more than nodes.
+        :param out_indices: Indices of heads, grouped by tail.
+        :param in_offsets: Offsets into in_indices, one more than nodes.
+        :param in_indices: Indices of tails, grouped by head.
+        :param node_tags: Dict of tag name to dict of node ID to value.
+        :param edge_tags: Dict of tag name to dict of edge to value.
+        :param multiplicity: Dict of edge to multiplicity, if above 1.
+        :param multigraph: Thaw as multigraph, implied by multiplicities.
+        """
+        """Index to ID."""
+        self._ids = ids
+        """ID to index."""
+        self._index = {id: i for i, id in enumerate(ids)}
+        """Outgoing edges in CSR layout."""
+        self._out_offsets = out_offsets
+        self._out_indices = out_indices
+        """Incoming edges in CSR layout."""
+        self._in_offsets = in_offsets
+        self._in_indices = in_indices
+        """Tag columns."""
+        self._node_tags = node_tags or {}
+        self._edge_tags = edge_tags or {}
+        """Edge to multiplicity, for multiplicities above 1."""
+        self._multiplicity = multiplicity or {}
+        """Thaw as multigraph."""
+        self._multigraph = multigraph or bool(self._multiplicity)
+        self._duplicates = 0
+        """Node to repeated insertions of its outgoing and incoming edges."""
+        self._out_extra = {}
+        self._in_extra = {}
+        for (tail, head), count in self._multiplicity.items():
+            self._duplicates += count - 1
+            self._out_extra[tail] = self._out_extra.get(tail, 0) + count - 1
+            self._in_extra[head] = self._in_extra.get(head, 0) + count - 1
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Build the CSR arrays from a `Graph`.
+
+        :param graph: The graph to freeze.
+        :return: FrozenGraph
+        """
+        ids = list(graph._nodes)
+        index = {id: i for i, id in enumerate(ids)}
+        out_offsets, out_indices = cls._csr(ids, index, graph._tails)
+        in_offsets, in_indices = cls._csr(ids, index, graph._heads)
+        node_tags = {name: dict(column)
+                     for name, column in graph._node_tags.items()}
+        edge_tags = {name: dict(column)
+                     for name, column in graph._edge_tags.items()}
+        return cls(ids, out_offsets, out_indices, in_offsets, in_indices,
+                   node_tags, edge_tags, dict(graph._multiplicity),
+                   graph._multigraph)
+
+    @staticmethod
+    def _csr(ids, index, adjacency):
+        offsets = array('q', [0])
+        indices = array('q')
+        for id in ids:
+            indices.extend(sorted(index[other] for other in adjacency[id]))
+            offsets.append(len(indices))
+        return offsets, indices
+
+    def thaw(self):
+        """Return a mutable copy as `Graph`.
+
+        :return: Graph
+        """
+        graph = Graph(multigraph=self._multigraph)
+        graph.add_nodes_from(self._ids)
+        graph.add_edges_from(self.edges)
+        for edge, count in self._multiplicity.items():
+            graph._increment(edge, count - 1)
+        for name, column in self._node_tags.items():
+            graph.set_node_tags(name, column)
+        for name, column in self._edge_tags.items():
+            graph.set_edge_tags(name, column)
+        return graph
+
+    def subgraph(self, ids):
+        """Return the subgraph induced by the given nodes.
+
+        Tags and multiplicities of the kept nodes and edges are copied.
+
+        Raises KeyError if a node does not exist.
+
+        :param ids: Iterable of node IDs, in the order of the new graph.
+        :return: FrozenGraph
+        """
+        ids = list(dict.fromkeys(ids))
+        members = [self._index[id] for id in ids]
+        position = {i: j for j, i in enumerate(members)}
+        out_offsets, out_indices = self._induced(
+            members, position, self._out_offsets, self._out_indices)
+        in_offsets, in_indices = self._induced(
+            members, position, self._in_offsets, self._in_indices)
+        edges = []
+        if self._edge_tags or self._multiplicity:
+            edges = [(ids[t], ids[out_indices[j]]) for t in range(len(ids))
+                     for j in range(out_offsets[t], out_offsets[t + 1])]
+        node_tags = {}
+        for name, column in self._node_tags.items():
+            values = {id: column[id] for id in ids if id in column}
+            if values:
+                node_tags[name] = values
+        edge_tags = {}
+        for name, column in self._edge_tags.items():
+            values = {edge: column[edge] for edge in edges if edge in column}
+            if values:
+                edge_tags[name] = values
+        multiplicity = {edge: self._multiplicity[edge] for edge in edges
+                        if edge in self._multiplicity}
+        return type(self)(ids, out_offsets, out_indices, in_offsets,
+                          in_indices, node_tags, edge_tags, multiplicity,
+                          self._multigraph)
+
+    @staticmethod
+    def _induced(members, position, offsets, indices):
+        new_offsets = array('q', [0])
+        new_indices = array('q')
+        for i in members:
+            others = [position[j] for j in indices[offsets[i]:offsets[i + 1]]
+                      if j in position]
+            others.sort()
+            new_indices.extend(others)
+            new_offsets.append(len(new_indices))
+        return new_offsets, new_indices
+
+    def save(self, path):
+        """Write the graph to a binary snapshot file.
+
+        The file holds a header, the four CSR arrays as 64 bit integers,
+        the ID table and the pickled tag columns, multiplicities and
+        multigraph flag. Integer IDs are stored as a 64 bit array, any other
+        IDs as pickled list. All sections are aligned to 8 bytes, so they can
+        be mapped directly.
+
+        :param path: Path of the file.
+        """
+        ids = self._ids
+        if all(type(id) is int and -2 ** 63 <= id < 2 ** 63 for id in ids):
+            kind, table = INTEGER_IDS, self._little(array('q', ids))
+        else:
+            kind, table = PICKLED_IDS, pickle.dumps(
+                list(ids), pickle.HIGHEST_PROTOCOL)
+        header = HEADER.pack(MAGIC, VERSION, kind, len(ids),
+                             len(self._out_indices), len(table))
+        rest = pickle.dumps((self._node_tags, self._edge_tags,
+                             self._multiplicity, self._multigraph),
+                            pickle.HIGHEST_PROTOCOL)
+        with open(path, 'wb') as file:
+            file.write(header)
+            for values in (self._out_offsets, self._out_indices,
+                           self._in_offsets, self._in_indices):
+                file.write(self._little(array('q', values)))
+            file.write(table)
+            file.write(bytes(_padding(len(table))))
+            file.write(rest)
+
+    @staticmethod
+    def _little(values):
+        if sys.byteorder != 'little':
+            values.byteswap()
+        return values.tobytes()
+
+    @classmethod
+    def load(cls, path, mapped=True):
+        """Read a graph from a binary snapshot file written by *save*.
+
+        If *mapped*, the file is memory mapped read-only and the CSR arrays
+        and integer ID tables are memoryviews into the mapping. Nothing is
+        parsed or copied but the mapping from IDs to indices, the tags and
+        the multiplicities. The pages of the file are shared by all
+        processes mapping it. Else the arrays are read into memory.
+
+        The tags are unpickled, so only load files of trusted origin.
+
+        Raises ValueError if the file is no snapshot.
+
+        :param path: Path of the file.
+        :param mapped: Map the file instead of reading it.
+        :return: FrozenGraph
+        """
+        with open(path, 'rb') as file:
+            if mapped and sys.byteorder == 'little':
+                buffer = memoryview(mmap.mmap(file.fileno(), 0,
+                                              access=mmap.ACCESS_READ))
+            else:
+                buffer = memoryview(file.read())
+                mapped = False
+        if len(buffer) < HEADER.size:
+            raise ValueError('No snapshot: {}.'.format(path))
+        magic, version, kind, nodes, edges, length = HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('No snapshot: {}.'.format(path))
+        position = HEADER.size
+
+        def section(count):
+            nonlocal position
+            start, position = position, position + 8 * count
+            if mapped:
+                return buffer[start:position].cast('q')
+            values = array('q')
+            values.frombytes(buffer[start:position])
+            if sys.byteorder != 'little':
+                values.byteswap()
+            return values
+
+        out_offsets, out_indices = section(nodes + 1), section(edges)
+        in_offsets, in_indices = section(nodes + 1), section(edges)
+        if kind == INTEGER_IDS:
+            ids = section(nodes)
+        else:
+            ids = pickle.loads(buffer[position:position + length])
+            position += length
+        position += _padding(length)
+        node_tags, edge_tags, multiplicity, multigraph = pickle.loads(
+            buffer[position:])
+        return cls(ids, out_offsets, out_indices, in_offsets, in_indices,
+                   node_tags, edge_tags, multiplicity, multigraph)
+
+    def index(self, id):
+        """Return the dense index of a node.
+
+        Raises NodeMissing if the node does not exist.
+
+        :param id: ID of node.
+        :return: Integer index.
+        """
+        try:
+            return self._index[id]
+        except KeyError:
+            raise self.NodeMissing('No node {}.'.format(id)) from None
+
+    def node_exists(self, id):
+        """Check if the given node exists.
+
+        :param id: Id of the node.
+        :return: True if node exists else false.
+        """
+        return id in self._index
+
+    def edge_exists(self, tail, head):
+        """Check if the given edge exists.
+
+        :param tail: Node id of tail.
+        :param head: Node id of head.
+        :return: True if edge exists else false.
+        """
+        index = self._index
+        if tail not in index or head not in index:
+            return False
+        t, h = index[tail], index[head]
+        indices = self._out_indices
+        hi = self._out_offsets[t + 1]
+        position = bisect_left(indices, h, self._out_offsets[t], hi)
+        return position < hi and indices[position] == h
+
+    def node_tag_exists(self, id, name):
+        """Check if tag exists in node.
+
+        Raises NodeMissing if the node does not exist.
+
+        :param id: Node ID.
+        :param name: Tag name.
+        :return: Tags existence as boolean.
+        """
+        if not self.node_exists(id):
+            raise self.NodeMissing('No node {}.'.format(id))
+        return id in self._node_tags.get(name, ())
+
+    def edge_tag_exists(self, tail, head, name):
+        """Check if tag exists in edge.
+
+        Raises EdgeMissing if the edge does not exist.
+
+        :param tail: ID of tail node.
+        :param head: ID of head node.
+        :param name: Tag name.
+        :return: Tags existence as boolean.
+        """
+        if not self.edge_exists(tail, head):
+            raise self.EdgeMissing('No edge ({}, {}).'.format(tail, head))
+        return (tail, head) in self._edge_tags.get(name, ())
+
+    def node_tag(self, id, name):
+        """Get the value of a node tag.
+
+        Raises NodeMissing if the given node does not exist.
+        Raises NodeTagMissing if the given tag does not exist.
+
+        :param id: ID of node.
+        :param name: Name of tag.
+        :return: Value of tag.
+        """
+        if not self.node_tag_exists(id, name):
+            raise self.NodeTagMissing('No tag {} in node {}.'.format(name, id))
+        return self._node_tags[name][id]
+
+    def edge_tag(self, tail, head, name):
+        """Get the value of an edge tag.
+
+        Raises EdgeMissing if the given edge does not exist.
+        Raises EdgeTagMissing if the given tag does not exist.
+
+        :param tail: Tail of edge.
+        :param head: Head of edge.
+        :param name: Name of tag.
+        :return: Value of tag.
+        """
+        if not self.edge_tag_exists(tail, head, name):
+            raise self.EdgeTagMissing(
+                'No tag {} in edge ({}, {}).'.format(name, tail, head))
+        return self._edge_tags[name][(tail, head)]
+
+    def get_node_tags(self, name):
+        """Get the values of a tag for all nodes carrying it.
+
+        :param name: Name of tag.
+        :return: Read-only mapping of node ID to value.
+        """
+        return MappingProxyType(self._node_tags.get(name, {}))
+
+    def get_edge_tags(self, name):
+        """Get the values of a tag for all edges carrying it.
+
+        :param name: Name of tag.
+        :return: Read-only mapping of (tail, head) to value.
+        """
+        return MappingProxyType(self._edge_tags.get(name, {}))
+
+    def multiplicity(self, tail, head):
+        """Get the multiplicity of an edge.
+
+        Raises EdgeMissing if the edge does not exist.
+
+        :param tail: ID of tail.
+        :param head: ID of head.
+        :return: Count of insertions of the edge.
+        """
+        if not self.edge_exists(tail, head):
+            raise self.EdgeMissing('No edge ({}, {}).'.format(tail, head))
+        return self._multiplicity.get((tail, head), 1)
+
+    @property
+    def nodes(self):
+        """Get a live view of all nodes."""
+        return self._index.keys()
+
+    @property
+    def edges(self):
+        """Get a live view of all distinct edges."""
+        return EdgesView(self)
+
+    def iter_nodes(self):
+        """Iterate all nodes without copying."""
+        return iter(self._ids)
+
+    def iter_edges(self):
+        """Iterate all distinct edges without copying."""
+        ids, offsets, indices = self._ids, self._out_offsets, self._out_indices
+        for t in range(len(ids)):
+            tail = ids[t]
+            for j in range(offsets[t], offsets[t + 1]):
+                yield tail, ids[indices[j]]
+
+    def predecessors(self, id):
+        """Return incoming nodes of ID.
+
+        :param id: ID of node.
+        :return: List of ID's.
+        """
+        i = self._index[id]
+        ids = self._ids
+        offsets = self._in_offsets
+        return [ids[j] for j in self._in_indices[offsets[i]:offsets[i + 1]]]
+
+    def successors(self, id):
+        """Return outgoing nodes of ID.
+
+        :param id: ID of node.
+        :return: List of ID's.
+        """
+        i = self._index[id]
+        ids = self._ids
+        offsets = self._out_offsets
+        return [ids[j] for j in self._out_indices[offsets[i]:offsets[i + 1]]]
+
+    def incoming(self, id):
+        """Return incoming edges of ID.
+
+        Each edge is repeated by its multiplicity.
+
+        :param id: ID of node.
+        :return: List of ID pairs (tail, head).
+        """
+        multiplicity = self._multiplicity
+        return [(tail, id) for tail in self.predecessors(id)
+                for _ in range(multiplicity.get((tail, id), 1))]
+
+    def outgoing(self, id):
+        """Return outgoing edges of ID.
+
+        Each edge is repeated by its multiplicity.
+
+        :param id: ID of node.
+        :return: List of ID pairs (tail, head).
+        """
+        multiplicity = self._multiplicity
+        return [(id, head) for head in self.successors(id)
+                for _ in range(multiplicity.get((id, head), 1))]
+
+    def in_degree(self, id):
+        """Return the count of incoming edges of a node.
+
+        :param id: ID of node.
+        :return: In-degree.
+        """
+        i = self._index[id]
+        offsets = self._in_offsets
+        return offsets[i + 1] - offsets[i] + self._in_extra.get(id, 0)
+
+    def out_degree(self, id):
+        """Return the count of outgoing edges of a node.
+
+        :param id: ID of node.
+        :return: Out-degree.
+        """
+        i = self._index[id]
+        offsets = self._out_offsets
+        return offsets[i + 1] - offsets[i] + self._out_extra.get(id, 0)
+
+    def degrees(self):
+        """Return the in- and out-degrees of all nodes.
+
+        Computed from the differences of the CSR offsets.
+
+        :return: Tuple of arrays of in- and out-degrees, in order of nodes.
+        """
+        degrees = []
+        for offsets, extra in ((self._in_offsets, self._in_extra),
+                               (self._out_offsets, self._out_extra)):
+            degree = array('q', map(sub, offsets[1:], offsets[:-1]))
+            for id, count in extra.items():
+                degree[self._index[id]] += count
+            degrees.append(degree)
+        return tuple(degrees)
+
+    def sources(self):
+        """Return the nodes without incoming edges.
+
+        :return: List of ID's.
+        """
+        offsets = self._in_offsets
+        return [id for i, id in enumerate(self._ids)
+                if offsets[i] == offsets[i + 1]]
+
+    def sinks(self):
+        """Return the nodes without outgoing edges.
+
+        :return: List of ID's.
+        """
+        offsets = self._out_offsets
+        return [id for i, id in enumerate(self._ids)
+                if offsets[i] == offsets[i + 1]]
+
+    def count_of_nodes(self):
+        """Return the count of all nodes.
+
+        :return: Count of nodes.
+        """
+        return len(self._ids)
+
+    def count_of_edges(self):
+        """Return the count of all edges.
+
+        The sum of the multiplicities.
+
+        :return: Count of edges.
+        """
+        return len(self._out_indices) + self._duplicates
@@ -1,10 +1,124 @@
+from array import array
+from collections import Counter
+from collections.abc import Collection, Set
+from contextlib import contextmanager
+from operator import itemgetter
+from types import MappingProxyType
+
+from jag.signalslot import SignalSlot
+
+
+def _column(values):
+    """Convert array like input (NumPy, array, memoryview) into a list.
+
+    Plain iterables are returned as they are.
+    """
+    tolist = getattr(values, 'tolist', None)
+    return values if tolist is None else tolist()
+
+
+class OutgoingView(Set):
+    """Live view of the outgoing edges of a node.
+
+    Like `dict.keys()` the view reflects later changes of the graph. Length
+    and membership are O(1), iteration creates the edge tuples lazily.
+    """
+
+    __slots__ = ('_id', '_others')
+
+    def __init__(self, id, others):
+        self._id = id
+        self._others = others
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        return set(iterable)
+
+    def __len__(self):
+        return len(self._others)
+
+    def __contains__(self, edge):
+        try:
+            tail, head = edge
+        except (TypeError, ValueError):
+            return False
+        return tail == self._id and head in self._others
+
+    def __iter__(self):
+        id = self._id
+        return ((id, head) for head in self._others)
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, list(self))
+
+
+class IncomingView(OutgoingView):
+    """Live view of the incoming edges of a node. See: OutgoingView."""
+
+    __slots__ = ()
+
+    def __contains__(self, edge):
+        try:
+            tail, head = edge
+        except (TypeError, ValueError):
+            return False
+        return head == self._id and tail in self._others
+
+    def __iter__(self):
+        id = self._id
+        return ((tail, id) for tail in self._others)
+
+
+class MultiOutgoingView(Collection):
+    """Live view of the outgoing edges of a node in a multigraph.
+
+    Each edge is repeated by its multiplicity, in iteration and in length,
+    so the view is a collection, not a set. Length and membership are O(1).
+    """
+
+    __slots__ = ('_id', '_others', '_multiplicity', '_extra')
+
+    def __init__(self, id, others, multiplicity, extra):
+        self._id = id
+        self._others = others
+        self._multiplicity = multiplicity
+        self._extra = extra
+
+    def __len__(self):
+        return len(self._others) + self._extra.get(self._id, 0)
+
+    __contains__ = OutgoingView.__contains__
+    _edges = OutgoingView.__iter__
+    __repr__ = OutgoingView.__repr__
+
+    def __iter__(self):
+        multiplicity = self._multiplicity
+        for edge in self._edges():
+            for _ in range(multiplicity.get(edge, 1)):
+                yield edge
+
+
+class MultiIncomingView(MultiOutgoingView):
+    """Live view of the incoming edges of a node in a multigraph."""
+
+    __slots__ = ()
+
+    __contains__ = IncomingView.__contains__
+    _edges = IncomingView.__iter__
+
+
 # noinspection PyShadowingBuiltins
-class Graph:
+class Graph(SignalSlot):
     """A monolithic implementation of a graph.
     
     While `challenges.Graph` implements edges and nodes as real objects, this
     class is a monolithic implementation of a graph to achieve a better 
     performance.
+
+    Observers can register slots for the signals *node_created* and
+    *node_removed* with the ID and *edge_created* and *edge_removed* with
+    tail and head, sent after each change. Without slots the signals cost
+    nothing.
     
     """
 
@@ -39,17 +153,47 @@ class Graph:
     class CycleInDAG(Error):
         pass
 
-    def __init__(self):
-        """Initialise an empty graph. """
+    def __init__(self, checked=True, multigraph=False):
+        """Initialise an empty graph.
+
+        In checked mode (the default) every mutation re-validates the internal
+        model. With `checked=False` the mutation methods skip the consistency
+        checks and touch each dict only as often as necessary. Use it to load
+        large graphs from trusted input. See also: *unchecked*.
 
-        """Flags of nodes."""
+        In multigraph mode inserting an existing edge again increments the
+        multiplicity of the edge instead of dropping it. The multiplicities
+        are kept in a counter apart from the edge tags, holding only the
+        edges inserted more than once.
+
+        :param checked: Validate the internal model on mutation.
+        :param multigraph: Count repeated edges.
+        """
+        super().__init__()
+
+        """Validate the internal model on mutation."""
+        self._checked = checked
+        """Count repeated edges."""
+        self._multigraph = multigraph
+        """Edge to multiplicity, for multiplicities above 1."""
+        self._multiplicity = Counter()
+        """Count of repeated insertions of edges beyond the first."""
+        self._duplicates = 0
+        """Node to repeated insertions of its outgoing and incoming edges."""
+        self._out_extra = Counter()
+        self._in_extra = Counter()
+        """Registry of nodes."""
         self._nodes = {}
         """Tail to heads."""
         self._tails = {}
         """Head to tails."""
         self._heads = {}
-        """Flags of edges."""
+        """Registry of edges."""
         self._edges = {}
+        """Tag name to column of node to value."""
+        self._node_tags = {}
+        """Tag name to column of edge to value."""
+        self._edge_tags = {}
 
     def node_exists(self, id):
         """Check if the given node exists.
@@ -109,7 +253,7 @@ class Graph:
         """
         if not self.node_exists(id):
             raise self.NodeMissing('No node {}.'.format(id))
-        return name in self._nodes[id]
+        return id in self._node_tags.get(name, ())
 
     def edge_tag_exists(self, tail, head, name):
         """Check if tag exists in edge.
@@ -123,7 +267,7 @@ class Graph:
         """
         if not self.edge_exists(tail, head):
             raise self.EdgeMissing('No edge ({}, {}).'.format(tail, head))
-        return name in self._edges[(tail, head)]
+        return (tail, head) in self._edge_tags.get(name, ())
 
     def create_node(self, id):
         """Register a node of the graph.
@@ -136,11 +280,22 @@ class Graph:
         :param id: The id of the node.
         :return: False if the node already exists, else True.
         """
+        if not self._checked:
+            if id in self._nodes:
+                return False
+            self._tails[id] = set()
+            self._heads[id] = set()
+            self._nodes[id] = None
+            if self._dispatch:
+                self.signal('node_created', id)
+            return True
         if not self.node_exists(id):
             self._tails[id] = set()
             self._heads[id] = set()
-            self._nodes[id] = dict()
+            self._nodes[id] = None
             self.node_exists(id)  # Check consistency after creation.
+            if self._dispatch:
+                self.signal('node_created', id)
             return True
         else:
             return False
@@ -148,23 +303,260 @@ class Graph:
     def create_edge(self, tail, head):
         """Add an edge.
 
-        Create nodes as necessary.
+        Create nodes as necessary. In multigraph mode an existing edge gets
+        its multiplicity incremented.
 
         :param tail: ID of tail. 
         :param head: ID of head.
-        :return: False if the node already exists, else True.
+        :return: False if the edge already exists, else True.
         """
+        if not self._checked:
+            return self._create_edge_unchecked(tail, head)
         self.create_node(tail)
         self.create_node(head)
         id = (tail, head)
         if not self.edge_exists(tail, head):
-            self._edges[id] = dict()
+            self._edges[id] = None
             self._heads[head].add(tail)
             self._tails[tail].add(head)
             self.edge_exists(tail, head)  # Check consistency after creation.
+            if self._dispatch:
+                self.signal('edge_created', tail, head)
             return True
         else:
+            if self._multigraph:
+                self._increment(id, 1)
+            return False
+
+    def _create_edge_unchecked(self, tail, head):
+        tails = self._tails
+        heads = self._heads
+        successors = tails.get(tail)
+        if successors is None:
+            successors = tails[tail] = set()
+            heads[tail] = set()
+            self._nodes[tail] = None
+            if self._dispatch:
+                self.signal('node_created', tail)
+        elif head in successors:
+            if self._multigraph:
+                self._increment((tail, head), 1)
             return False
+        predecessors = heads.get(head)
+        if predecessors is None:
+            tails[head] = set()
+            predecessors = heads[head] = set()
+            self._nodes[head] = None
+            if self._dispatch:
+                self.signal('node_created', head)
+        successors.add(head)
+        predecessors.add(tail)
+        self._edges[(tail, head)] = None
+        if self._dispatch:
+            self.signal('edge_created', tail, head)
+        return True
+
+    def _increment(self, edge, count):
+        self._multiplicity[edge] = self._multiplicity.get(edge, 1) + count
+        self._duplicates += count
+        self._out_extra[edge[0]] += count
+        self._in_extra[edge[1]] += count
+
+    @contextmanager
+    def unchecked(self):
+        """Context manager to temporarily switch off the consistency checks.
+
+        Restores the previous mode on exit::
+
+            with graph.unchecked():
+                for tail, head in pairs:
+                    graph.create_edge(tail, head)
+        """
+        checked = self._checked
+        self._checked = False
+        try:
+            yield self
+        finally:
+            self._checked = checked
+
+    def add_nodes_from(self, ids):
+        """Register many nodes at once.
+
+        Existing nodes are skipped. The internal dicts are updated in
+        batches without per-node consistency checks.
+
+        :param ids: Iterable or array of node IDs.
+        :return: Count of nodes created.
+        """
+        nodes = self._nodes
+        new = [id for id in dict.fromkeys(_column(ids)) if id not in nodes]
+        self._tails.update((id, set()) for id in new)
+        self._heads.update((id, set()) for id in new)
+        nodes.update(dict.fromkeys(new))
+        emit = self.dispatcher('node_created')
+        if emit is not None:
+            for id in new:
+                emit(id)
+        return len(new)
+
+    def add_edges_from(self, edges, heads=None):
+        """Add many edges at once.
+
+        Accepts an iterable of (tail, head) pairs, an (N, 2) array or
+        buffer, or two columns of tails and heads given as `edges` and
+        `heads`. Nodes are created as necessary, existing edges are skipped.
+        In multigraph mode the multiplicities of repeated and existing edges
+        are incremented in bulk.
+
+        The new edges are collected with C level dict operations first, then
+        the nodes and edges are stored with batched updates and without
+        per-edge consistency checks or method calls.
+
+        :param edges: Pairs of (tail, head) or the column of tails.
+        :param heads: The column of heads, if `edges` are tails only.
+        :return: Count of edges created.
+        """
+        if heads is None:
+            pairs = map(tuple, _column(edges))
+        else:
+            pairs = zip(_column(edges), _column(heads))
+        all_edges = self._edges
+        if self._multigraph:
+            counts = Counter(pairs)
+            for edge, count in counts.items():
+                if edge not in all_edges:
+                    count -= 1
+                if count:
+                    self._increment(edge, count)
+        else:
+            counts = dict.fromkeys(pairs)
+        new = [edge for edge in counts if edge not in all_edges]
+        self.add_nodes_from(map(itemgetter(0), new))
+        self.add_nodes_from(map(itemgetter(1), new))
+        tails, heads = self._tails, self._heads
+        for tail, head in new:
+            tails[tail].add(head)
+            heads[head].add(tail)
+        all_edges.update(dict.fromkeys(new))
+        emit = self.dispatcher('edge_created')
+        if emit is not None:
+            for tail, head in new:
+                emit(tail, head)
+        return len(new)
+
+    def remove_edge(self, tail, head):
+        """Remove an edge, with its tags and multiplicity.
+
+        The nodes are kept. The cost is independent of the size of the
+        graph.
+
+        Raises EdgeMissing if the edge does not exist.
+
+        :param tail: ID of tail.
+        :param head: ID of head.
+        """
+        if not self.edge_exists(tail, head):
+            raise self.EdgeMissing('No edge ({}, {}).'.format(tail, head))
+        self._remove_edge((tail, head))
+
+    def _remove_edge(self, edge):
+        tail, head = edge
+        self._tails[tail].discard(head)
+        self._heads[head].discard(tail)
+        del self._edges[edge]
+        for name in [name for name, column in self._edge_tags.items()
+                     if edge in column]:
+            self._untag(self._edge_tags, edge, name)
+        count = self._multiplicity.pop(edge, 1) - 1
+        if count:
+            self._duplicates -= count
+            self._out_extra[tail] -= count
+            self._in_extra[head] -= count
+            if not self._out_extra[tail]:
+                del self._out_extra[tail]
+            if not self._in_extra[head]:
+                del self._in_extra[head]
+        if self._dispatch:
+            self.signal('edge_removed', tail, head)
+
+    def remove_edges_from(self, edges):
+        """Remove many edges at once.
+
+        Edges that don't exist are skipped.
+
+        :param edges: Iterable of (tail, head) pairs.
+        :return: Count of edges removed.
+        """
+        all_edges = self._edges
+        removed = [edge for edge in dict.fromkeys(map(tuple, edges))
+                   if edge in all_edges]
+        for edge in removed:
+            self._remove_edge(edge)
+        return len(removed)
+
+    def remove_node(self, id):
+        """Remove a node with its edges and tags.
+
+        The cost is proportional to the degree of the node.
+
+        Raises NodeMissing if the node does not exist.
+
+        :param id: ID of node.
+        """
+        if not self.node_exists(id):
+            raise self.NodeMissing('No node {}.'.format(id))
+        for head in list(self._tails[id]):
+            self._remove_edge((id, head))
+        for tail in list(self._heads[id]):
+            self._remove_edge((tail, id))
+        del self._tails[id]
+        del self._heads[id]
+        del self._nodes[id]
+        for name in [name for name, column in self._node_tags.items()
+                     if id in column]:
+            self._untag(self._node_tags, id, name)
+        if self._dispatch:
+            self.signal('node_removed', id)
+
+    def contract(self, path, id=None):
+        """Contract a path of nodes into a single node.
+
+        The predecessors of the first node and the successors of the last
+        node of the path are connected to the new node. Edges from the end of
+        the path back to its start become a loop. The tags of the path are
+        dropped. Typically used to compact non-branching paths.
+
+        Raises EdgeMissing if the path is not connected by edges.
+
+        :param path: List of node IDs, connected by edges.
+        :param id: ID of the new node, by default the first of the path.
+        :return: ID of the new node.
+        """
+        for tail, head in zip(path, path[1:]):
+            if not self.edge_exists(tail, head):
+                raise self.EdgeMissing('No edge ({}, {}).'.format(tail, head))
+        if id is None:
+            id = path[0]
+        members = set(path)
+        first, last = path[0], path[-1]
+        boundary = dict.fromkeys((tail, first)
+                                 for tail in self.predecessors(first))
+        boundary.update(dict.fromkeys((last, head)
+                                      for head in self.successors(last)))
+        counts = Counter()
+        for tail, head in boundary:
+            edge = (id if tail in members else tail,
+                    id if head in members else head)
+            counts[edge] += self._multiplicity.get((tail, head), 1)
+        for node in members:
+            self.remove_node(node)
+        self.create_node(id)
+        self.add_edges_from(counts)
+        if self._multigraph:
+            for edge, count in counts.items():
+                if count > 1:
+                    self._increment(edge, count - 1)
+        return id
 
     def tag_node(self, id, name, value=True):
         """Set a tag of a node with a freely selectable value.
@@ -178,22 +570,30 @@ class Graph:
         """
         if not self.node_exists(id):
             raise self.NodeMissing('No node {}.'.format(id))
-        self._nodes[id][name] = value
+        self._node_tags.setdefault(name, {})[id] = value
 
     def untag_node(self, id, name):
         """Remove a tag from a node.
+
+        Raises NodeMissing if the given node does not exist.
         
         :param id: Node to untag. 
         :param name: Name of the tag. 
+        :return: False if the tag did not exist, else True.
         """
         if not self.node_exists(id):
             raise self.NodeMissing('No node {}.'.format(id))
-        # TODO document and test return
-        if name in self._nodes[id]:
-            del (self._nodes[id][name])
-            return True
-        else:
+        return self._untag(self._node_tags, id, name)
+
+    @staticmethod
+    def _untag(columns, key, name):
+        column = columns.get(name)
+        if column is None or key not in column:
             return False
+        del column[key]
+        if not column:
+            del columns[name]
+        return True
 
     def node_tag(self, id, name):
         """Get the value of a node tag.
@@ -207,9 +607,10 @@ class Graph:
         """
         if not self.node_exists(id):
             raise self.NodeMissing('No node {}.'.format(id))
-        if name not in self._nodes[id]:
+        column = self._node_tags.get(name, ())
+        if id not in column:
             raise self.NodeTagMissing('No tag {} in node {}.'.format(name, id))
-        return self._nodes[id][name]
+        return column[id]
 
     def tag_edge(self, tail, head, name, value=True):
         """Set a tag of a edge with a freely selectable value.
@@ -224,19 +625,21 @@ class Graph:
         """
         if not self.edge_exists(tail, head):
             raise self.EdgeMissing('No edge ({}, {}).'.format(tail, head))
-        self._edges[(tail, head)][name] = value
+        self._edge_tags.setdefault(name, {})[(tail, head)] = value
 
     def untag_edge(self, tail, head, name):
         """Remove a tag from an edge.
+
+        Raises EdgeMissing if the given edge does not exist.
         
         :param tail: ID of tail.
         :param head: ID of head.
         :param name: Name of the tag. 
+        :return: False if the tag did not exist, else True.
         """
         if not self.edge_exists(tail, head):
             raise self.EdgeMissing('No edge ({}, {}).'.format(tail, head))
-        # TODO see untag_node
-        del (self._edges[(tail, head)][name])
+        return self._untag(self._edge_tags, (tail, head), name)
 
     def edge_tag(self, tail, head, name):
         """Get the value of an edge tag.
@@ -251,23 +654,95 @@ class Graph:
         """
         if not self.edge_exists(tail, head):
             raise self.EdgeMissing('No edge ({}, {}).'.format(tail, head))
-        if name not in self._edges[(tail, head)]:
+        column = self._edge_tags.get(name, ())
+        if (tail, head) not in column:
             raise self.EdgeTagMissing(
                 'No tag {} in edge ({}, {}).'.format(name, tail, head))
-        return self._edges[(tail, head)][name]
+        return column[(tail, head)]
+
+    def get_node_tags(self, name):
+        """Get the values of a tag for all nodes carrying it.
+
+        :param name: Name of tag.
+        :return: Read-only live mapping of node ID to value.
+        """
+        return MappingProxyType(self._node_tags.get(name, {}))
+
+    def set_node_tags(self, name, values):
+        """Set a tag for many nodes at once.
+
+        Raises NodeMissing, before any change, if a node does not exist.
+
+        :param name: Name of tag.
+        :param values: Mapping or pairs of node ID and value.
+        """
+        values = dict(values)
+        missing = values.keys() - self._nodes.keys()
+        if missing:
+            raise self.NodeMissing('No node {}.'.format(next(iter(missing))))
+        if values:
+            self._node_tags.setdefault(name, {}).update(values)
+
+    def get_edge_tags(self, name):
+        """Get the values of a tag for all edges carrying it.
+
+        :param name: Name of tag.
+        :return: Read-only live mapping of (tail, head) to value.
+        """
+        return MappingProxyType(self._edge_tags.get(name, {}))
+
+    def set_edge_tags(self, name, values):
+        """Set a tag for many edges at once.
+
+        Raises EdgeMissing, before any change, if an edge does not exist.
+
+        :param name: Name of tag.
+        :param values: Mapping or pairs of (tail, head) and value.
+        """
+        values = dict(values)
+        missing = values.keys() - self._edges.keys()
+        if missing:
+            raise self.EdgeMissing('No edge ({}, {}).'.format(
+                *next(iter(missing))))
+        if values:
+            self._edge_tags.setdefault(name, {}).update(values)
+
+    def multiplicity(self, tail, head):
+        """Get the multiplicity of an edge.
+
+        Always 1 unless in multigraph mode.
+        Raises EdgeMissing if the edge does not exist.
+
+        :param tail: ID of tail.
+        :param head: ID of head.
+        :return: Count of insertions of the edge.
+        """
+        if not self.edge_exists(tail, head):
+            raise self.EdgeMissing('No edge ({}, {}).'.format(tail, head))
+        return self._multiplicity.get((tail, head), 1)
 
     @property
     def nodes(self):
-        """Get a list of all nodes."""
-        return list(self._nodes.keys())
+        """Get a live view of all nodes."""
+        return self._nodes.keys()
 
     @property
     def edges(self):
-        """Get a list of all edges."""
-        return list(self._edges.keys())
+        """Get a live view of all distinct edges."""
+        return self._edges.keys()
+
+    def iter_nodes(self):
+        """Iterate all nodes without copying."""
+        return iter(self._nodes)
+
+    def iter_edges(self):
+        """Iterate all distinct edges without copying."""
+        return iter(self._edges)
 
     def predecessors(self, id):
         """Return incoming nodes of ID.
+
+        The nodes are distinct, also in multigraph mode. See *incoming*.
         
         :param id: ID of node.
         :return: Set of ID's.
@@ -276,6 +751,8 @@ class Graph:
 
     def successors(self, id):
         """Return outgoing nodes of ID.
+
+        The nodes are distinct, also in multigraph mode. See *outgoing*.
         
         :param id: ID of node.
         :return: Set of ID's.
@@ -284,25 +761,31 @@ class Graph:
 
     def incoming(self, id):
         """Return incoming edges of ID.
+
+        In multigraph mode the view holds each edge by its multiplicity.
         
         :param id: ID of node.
-        :return: Set of ID pairs (tail, head).
+        :return: Live view of ID pairs (tail, head), a set unless in
+            multigraph mode.
         """
-        edges = set()
-        for node in self._heads[id]:
-            edges.add((node, id))
-        return edges
+        if self._multigraph:
+            return MultiIncomingView(id, self._heads[id], self._multiplicity,
+                                     self._in_extra)
+        return IncomingView(id, self._heads[id])
 
     def outgoing(self, id):
         """Return outgoing edges of ID.
+
+        In multigraph mode the view holds each edge by its multiplicity.
         
         :param id: ID of node.
-        :return: Set of ID pairs (tail, head).
+        :return: Live view of ID pairs (tail, head), a set unless in
+            multigraph mode.
         """
-        edges = set()
-        for node in self._tails[id]:
-            edges.add((id, node))
-        return edges
+        if self._multigraph:
+            return MultiOutgoingView(id, self._tails[id], self._multiplicity,
+                                     self._out_extra)
+        return OutgoingView(id, self._tails[id])
 
     def count_of_nodes(self):
         """Return the count of all nodes.
@@ -313,8 +796,115 @@ class Graph:
 
     def count_of_edges(self):
         """Return the count of all edges.
+
+        In multigraph mode the sum of the multiplicities.
         
         :return: Count of nodes. 
         """
-        return len(self._edges)
+        return len(self._edges) + self._duplicates
+
+    def in_degree(self, id):
+        """Return the count of incoming edges of a node.
+
+        In multigraph mode the multiplicities are counted. O(1).
+
+        :param id: ID of node.
+        :return: In-degree.
+        """
+        return len(self._heads[id]) + self._in_extra.get(id, 0)
+
+    def out_degree(self, id):
+        """Return the count of outgoing edges of a node.
+
+        In multigraph mode the multiplicities are counted. O(1).
+
+        :param id: ID of node.
+        :return: Out-degree.
+        """
+        return len(self._tails[id]) + self._out_extra.get(id, 0)
+
+    def degrees(self):
+        """Return the in- and out-degrees of all nodes.
+
+        In multigraph mode the multiplicities are counted.
+
+        :return: Tuple of arrays of in- and out-degrees, in order of nodes.
+        """
+        nodes = self._nodes
+        in_degrees = array('q', map(len, map(self._heads.__getitem__, nodes)))
+        out_degrees = array('q', map(len, map(self._tails.__getitem__, nodes)))
+        if self._duplicates:
+            position = {id: i for i, id in enumerate(nodes)}
+            for id, count in self._in_extra.items():
+                in_degrees[position[id]] += count
+            for id, count in self._out_extra.items():
+                out_degrees[position[id]] += count
+        return in_degrees, out_degrees
+
+    def sources(self):
+        """Return the nodes without incoming edges.
+
+        :return: List of ID's.
+        """
+        return [id for id, tails in self._heads.items() if not tails]
+
+    def sinks(self):
+        """Return the nodes without outgoing edges.
+
+        :return: List of ID's.
+        """
+        return [id for id, heads in self._tails.items() if not heads]
 
+    def topological_order(self):
+        """Return the nodes in topological order.
+
+        Kahn's algorithm on the in-degree counts, linear in nodes and edges.
+        Raises CycleInDAG if the graph has a cycle.
+
+        :return: List of ID's.
+        """
+        in_degree = {id: len(tails) for id, tails in self._heads.items()}
+        order = [id for id, degree in in_degree.items() if degree == 0]
+        heads = self._tails
+        for id in order:
+            for head in heads[id]:
+                degree = in_degree[head] - 1
+                in_degree[head] = degree
+                if degree == 0:
+                    order.append(head)
+        if len(order) != len(in_degree):
+            missing = len(in_degree) - len(order)
+            raise self.CycleInDAG('Cycle detected, {} of {} nodes are not '
+                                  'ordered.'.format(missing, len(in_degree)))
+        return order
+
+    def freeze(self):
+        """Return a read-only copy in compact CSR layout.
+
+        See: `jag.frozen.FrozenGraph`.
+
+        :return: FrozenGraph
+        """
+        from jag.frozen import FrozenGraph
+        return FrozenGraph.from_graph(self)
+
+    def save(self, path):
+        """Write the graph to a binary snapshot file.
+
+        See: `jag.frozen.FrozenGraph.save`.
+
+        :param path: Path of the file.
+        """
+        self.freeze().save(path)
+
+    @classmethod
+    def load(cls, path):
+        """Read a graph from a binary snapshot file.
+
+        Use `jag.frozen.FrozenGraph.load` to map the file read-only instead.
+
+        :param path: Path of the file.
+        :return: Graph
+        """
+        from jag.frozen import FrozenGraph
+        return FrozenGraph.load(path, mapped=False).thaw()
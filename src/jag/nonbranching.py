@@ -0,0 +1,79 @@
+from jag.graph import Graph
+
+
+def _degrees(graph):
+    """Return in- and out-degrees by node, counting multiplicities."""
+    in_degrees, out_degrees = graph.degrees()
+    return (dict(zip(graph.nodes, in_degrees)),
+            dict(zip(graph.nodes, out_degrees)))
+
+
+def maximal_nonbranching_paths(graph):
+    """Generate the maximal non-branching paths of a graph.
+
+    A path is non-branching if all of its inner nodes have exactly one
+    incoming and one outgoing edge. The paths start and end at branching
+    nodes, except for isolated cycles of non-branching nodes, which start
+    and end at the same node. Repeated edges of a multigraph are walked as
+    separate paths. In assembly the paths are known as unitigs.
+
+    The degrees are computed once up front, the walk is iterative and
+    linear in nodes and edges.
+
+    :param graph: The graph, Graph or FrozenGraph.
+    :return: Generator of lists of nodes.
+    """
+    in_degree, out_degree = _degrees(graph)
+    successors = graph.successors
+    multiplicity = graph._multiplicity
+    seen = set()
+    for node in graph.nodes:
+        if in_degree[node] == 1 and out_degree[node] == 1:
+            continue
+        for head in successors(node):
+            for _ in range(multiplicity.get((node, head), 1)):
+                path = [node, head]
+                while in_degree[head] == 1 and out_degree[head] == 1:
+                    seen.add(head)
+                    head = next(iter(successors(head)))
+                    path.append(head)
+                yield path
+    for node in graph.nodes:
+        if node in seen or in_degree[node] != 1 or out_degree[node] != 1:
+            continue
+        seen.add(node)
+        path = [node]
+        head = next(iter(successors(node)))
+        while head != node:
+            seen.add(head)
+            path.append(head)
+            head = next(iter(successors(head)))
+        path.append(node)
+        yield path
+
+
+def compact_nonbranching_paths(graph: Graph, tag='path'):
+    """Contract the inner nodes of each maximal non-branching path in place.
+
+    The inner nodes of a path become a single node, isolated cycles a
+    single node with a loop. The new node takes the ID of the first
+    contracted node and the contracted nodes as list in the node tag *tag*.
+
+    :param graph: The graph to compact.
+    :param tag: Name of the node tag for the contracted nodes.
+    :return: Count of contracted paths.
+    """
+    in_degree, out_degree = _degrees(graph)
+    count = 0
+    for path in list(maximal_nonbranching_paths(graph)):
+        start = path[0]
+        if in_degree[start] == 1 and out_degree[start] == 1:
+            nodes = path[:-1]
+        else:
+            nodes = path[1:-1]
+        if not nodes:
+            continue
+        id = graph.contract(nodes)
+        graph.tag_node(id, tag, nodes)
+        count += 1
+    return count
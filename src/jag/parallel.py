@@ -0,0 +1,137 @@
+import os
+from array import array
+from multiprocessing import Pool
+from tempfile import TemporaryDirectory
+
+from jag.components import UnionFind, strongly_connected_components
+from jag.frozen import FrozenGraph
+
+"""Count of batches per process, to balance uneven batches."""
+BATCHES_PER_PROCESS = 4
+
+"""The graph and function of a worker process, set by _initialize."""
+_shared = None
+_function = None
+
+
+def _initialize(path, function):
+    global _shared, _function
+    _shared = FrozenGraph.load(path)
+    _function = function
+
+
+def _call(arguments):
+    task, batch = arguments
+    return task(_shared, _function, batch)
+
+
+def _components_task(graph, function, batch):
+    return [function(graph.subgraph(ids)) for ids in batch]
+
+
+def _roots_task(graph, function, batch):
+    return [function(graph, root) for root in batch]
+
+
+def _batches(items, weight, count):
+    """Split items in order into about *count* batches of similar weight."""
+    items = list(items)
+    limit = sum(map(weight, items)) / max(count, 1)
+    batches, batch, total = [], [], 0
+    for item in items:
+        batch.append(item)
+        total += weight(item)
+        if total >= limit:
+            batches.append(batch)
+            batch, total = [], 0
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _execute(graph, function, task, items, weight, processes):
+    """Run the task on batches of the items and concatenate the results.
+
+    The graph is saved to a snapshot file, that each worker maps read-only.
+    The results are merged in the order of the items.
+    """
+    frozen = graph if isinstance(graph, FrozenGraph) else graph.freeze()
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes == 1:
+        return task(frozen, function, list(items))
+    batches = _batches(items, weight, processes * BATCHES_PER_PROCESS)
+    results = []
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'graph.jag')
+        frozen.save(path)
+        with Pool(processes, _initialize, (path, function)) as pool:
+            for result in pool.imap(_call, ((task, batch)
+                                            for batch in batches)):
+                results.extend(result)
+    return results
+
+
+def map_components(graph, function, processes=None):
+    """Run an analysis on each weakly connected component in parallel.
+
+    The components are found with union-find and grouped into batches of
+    similar size. A pool of processes calls *function* with the subgraph
+    of each component as `FrozenGraph`. The workers do not receive the
+    graph by pickling. Each of them maps the same snapshot file read-only.
+    The function and its results must be picklable, if the processes are
+    spawned rather than forked.
+
+    With a single process the analysis runs in the calling process.
+
+    :param graph: The graph, Graph or FrozenGraph.
+    :param function: Function of a FrozenGraph, defined at module level.
+    :param processes: Count of processes, by default the count of CPUs.
+    :return: List of pairs of component and result, the components as
+        lists of node IDs, in order of their first node.
+    """
+    components = UnionFind.from_graph(graph).components()
+    results = _execute(graph, function, _components_task, components, len,
+                       processes)
+    return list(zip(components, results))
+
+
+def map_roots(graph, function, roots, processes=None):
+    """Run an analysis from each of many root nodes in parallel.
+
+    Like *map_components*, but *function* is called with the whole graph
+    as `FrozenGraph` and a root, e.g. to run a search per root.
+
+    :param graph: The graph, Graph or FrozenGraph.
+    :param function: Function of a FrozenGraph and a node ID, defined at
+        module level.
+    :param roots: Iterable of node IDs.
+    :param processes: Count of processes, by default the count of CPUs.
+    :return: List of results in order of the roots.
+    """
+    return _execute(graph, function, _roots_task, roots, lambda root: 1,
+                    processes)
+
+
+def parallel_strongly_connected_components(graph, processes=None):
+    """Find the strongly connected components per weakly connected
+    component in parallel.
+
+    The numbers of each weakly connected component are shifted behind the
+    ones of the components before, so the result is deterministic and in
+    topological order of the condensation, like the one of
+    *strongly_connected_components*, though numbered differently.
+
+    :param graph: The graph, Graph or FrozenGraph.
+    :param processes: Count of processes, by default the count of CPUs.
+    :return: Array of component numbers in the order of graph.nodes.
+    """
+    position = {id: i for i, id in enumerate(graph.nodes)}
+    labels = array('q', [-1]) * len(position)
+    offset = 0
+    for ids, components in map_components(
+            graph, strongly_connected_components, processes):
+        for id, component in zip(ids, components):
+            labels[position[id]] = offset + component
+        offset += max(components) + 1
+    return labels
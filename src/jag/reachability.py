@@ -0,0 +1,215 @@
+from array import array
+from random import Random
+
+from jag.components import _dense, strongly_connected_components
+from jag.graph import Graph
+
+
+# noinspection PyShadowingBuiltins
+class ReachabilityIndex:
+    """Answer repeated queries whether a node can reach another one.
+
+    The index is built over the condensation of the graph, a DAG of the
+    strongly connected components, numbered in topological order. Each
+    component gets interval labels from a few depth first traversals with
+    different child orders (GRAIL). A query is answered in constant time
+    in the common cases:
+
+    1. Nodes of the same component reach each other.
+    2. A component never reaches a component with a lower number.
+    3. If the component lies in the subtree of the first traversal, it is
+       reached.
+    4. If the interval of the component is not contained in the interval
+       of the other one in every labeling, it is not reached.
+
+    Only the remaining queries search the condensation, pruned by the same
+    rules. The memory is linear in nodes and edges. The labelings are
+    independent of each other.
+
+    The index follows a `Graph` through its signals. A new node is added
+    in place. A new edge keeps the index valid if its head was reachable
+    from its tail already, else the index is rebuilt at the next query, as
+    after any removal.
+    """
+
+    def __init__(self, graph: Graph, labelings=2):
+        """Build the index of a graph.
+
+        :param graph: The graph, Graph or FrozenGraph.
+        :param labelings: Count of interval labelings, at least 1.
+        """
+        self._graph = graph
+        self._labelings = labelings
+        """Node to component number."""
+        self._component = {}
+        """Component to list of child components in the condensation."""
+        self._children = []
+        """Preorder numbers and postorder numbers of the first traversal."""
+        self._pre = array('q')
+        self._post = array('q')
+        """Per labeling, the postorder numbers and the lowest postorder
+        number in the subtree."""
+        self._labels = []
+        """The index has to be rebuilt before the next query."""
+        self._stale = True
+        if isinstance(graph, Graph):
+            graph.slot('node_created', self._add_node)
+            graph.slot('edge_created', self._add_edge)
+            graph.slot('node_removed', self._invalidate)
+            graph.slot('edge_removed', self._invalidate)
+        self.rebuild()
+
+    def rebuild(self):
+        """Build the index from scratch."""
+        graph = self._graph
+        components = strongly_connected_components(graph)
+        ids, successors = _dense(graph)
+        count = max(components, default=-1) + 1
+        children = [set() for _ in range(count)]
+        for i in range(len(ids)):
+            tail = components[i]
+            for j in successors(i):
+                if components[j] != tail:
+                    children[tail].add(components[j])
+        self._children = [sorted(heads) for heads in children]
+        self._component = dict(zip(ids, components))
+        self._labels = [self._label(Random(seed))
+                        for seed in range(self._labelings)]
+        self._pre, self._post = self._tree()
+        self._stale = False
+
+    def _label(self, random):
+        """Traverse the condensation in random child order.
+
+        :return: Tuple of arrays of postorder and lowest postorder number.
+        """
+        children = self._children
+        count = len(children)
+        post = array('q', [-1]) * count
+        low = array('q', [0]) * count
+        counter = 0
+        for root in random.sample(range(count), count):
+            if post[root] != -1:
+                continue
+            post[root] = -2
+            nodes = [root]
+            stack = [iter(random.sample(children[root], len(children[root])))]
+            while stack:
+                for child in stack[-1]:
+                    if post[child] == -1:
+                        post[child] = -2
+                        nodes.append(child)
+                        stack.append(iter(random.sample(
+                            children[child], len(children[child]))))
+                        break
+                else:
+                    stack.pop()
+                    node = nodes.pop()
+                    post[node] = counter
+                    low[node] = min([counter] + [low[child] for child
+                                                 in children[node]])
+                    counter += 1
+        return post, low
+
+    def _tree(self):
+        """Number a spanning forest of the condensation in pre- and
+        postorder. A node is in the subtree of another one if its numbers
+        are within the numbers of the other one."""
+        children = self._children
+        count = len(children)
+        pre = array('q', [-1]) * count
+        post = array('q', [-1]) * count
+        before = after = 0
+        for root in range(count):
+            if pre[root] != -1:
+                continue
+            pre[root] = before
+            before += 1
+            nodes = [root]
+            stack = [iter(children[root])]
+            while stack:
+                for child in stack[-1]:
+                    if pre[child] == -1:
+                        pre[child] = before
+                        before += 1
+                        nodes.append(child)
+                        stack.append(iter(children[child]))
+                        break
+                else:
+                    stack.pop()
+                    post[nodes.pop()] = after
+                    after += 1
+        return pre, post
+
+    def reachable(self, tail, head):
+        """Check if there is a path from one node to another one.
+
+        Each node reaches itself. Raises Graph.NodeMissing if a node does
+        not exist.
+
+        :param tail: ID of the start node.
+        :param head: ID of the end node.
+        :return: Boolean.
+        """
+        if self._stale:
+            self.rebuild()
+        component = self._component
+        for id in tail, head:
+            if id not in component:
+                raise self._graph.NodeMissing('No node {}.'.format(id))
+        source, target = component[tail], component[head]
+        if source == target:
+            return True
+        if source > target or not self._contains(source, target):
+            return False
+        if self._subtree(source, target):
+            return True
+        return self._search(source, target)
+
+    def _contains(self, source, target):
+        """Check the intervals of all labelings, False if not reachable."""
+        for post, low in self._labels:
+            if low[target] < low[source] or post[target] > post[source]:
+                return False
+        return True
+
+    def _subtree(self, source, target):
+        """Check the spanning forest, True if reachable."""
+        return (self._pre[source] <= self._pre[target]
+                and self._post[target] <= self._post[source])
+
+    def _search(self, source, target):
+        children = self._children
+        seen = {source}
+        stack = [source]
+        while stack:
+            for child in children[stack.pop()]:
+                if child == target:
+                    return True
+                if (child in seen or child > target
+                        or not self._contains(child, target)):
+                    continue
+                if self._subtree(child, target):
+                    return True
+                seen.add(child)
+                stack.append(child)
+        return False
+
+    def _add_node(self, id):
+        if self._stale:
+            return
+        number = len(self._children)
+        self._component[id] = number
+        self._children.append([])
+        for post, low in self._labels:
+            post.append(number)
+            low.append(number)
+        self._pre.append(number)
+        self._post.append(number)
+
+    def _add_edge(self, tail, head):
+        if not self._stale and not self.reachable(tail, head):
+            self._stale = True
+
+    def _invalidate(self, *args):
+        self._stale = True
@@ -1,26 +1,59 @@
-from collections import defaultdict
+class SignalSlot:
+    """Send signals to the methods (slots) registered for them.
 
+    The slots of a signal are resolved into a single callable when a slot is
+    registered, so sending a signal is one dict lookup and one call. Sending
+    a signal without slots costs nothing beyond the lookup.
+    """
 
-class SignalSlot:
     def __init__(self):
-        self._slots = defaultdict(list)
+        """Name of signal to list of slots."""
+        self._slots = {}
+        """Name of signal to compiled dispatch callable."""
+        self._dispatch = {}
 
     def slot(self, name, method):
         """Registry of methods (slots) to be triggered by signals.
-        
-        :param name: Name of the signal to subscribe to. 
+
+        :param name: Name of the signal to subscribe to.
         :param method: The method to be triggered.
-        :return: 
+        :return:
         """
-        self._slots[name].append(method)
+        methods = self._slots.setdefault(name, [])
+        methods.append(method)
+        self._dispatch[name] = self._compile(tuple(methods))
+
+    @staticmethod
+    def _compile(methods):
+        if len(methods) == 1:
+            return methods[0]
+
+        def dispatch(*args, **kwargs):
+            for method in methods:
+                method(*args, **kwargs)
+
+        return dispatch
+
+    def dispatcher(self, name):
+        """Return the callable sending a signal to all of its slots.
+
+        Hot loops resolve the callable once and call it with positional
+        arguments directly. Slots registered later are not seen by a
+        callable resolved before.
+
+        :param name: Name of the signal.
+        :return: Callable or None if there are no slots.
+        """
+        return self._dispatch.get(name)
 
     def signal(self, name, *args, **kwargs):
         """Trigger all methods (slots) registered for the signal.
-        
-        :param name: Name of the signal to send. 
+
+        :param name: Name of the signal to send.
         :param args: Arguments to be inserted into the slots.
         :param kwargs: Keyword arguments to be inserted into the slots.
-        :return: 
+        :return:
         """
-        for method in self._slots[name]:
-            method(*args, **kwargs)
+        dispatch = self._dispatch.get(name)
+        if dispatch is not None:
+            dispatch(*args, **kwargs)
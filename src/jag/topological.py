@@ -0,0 +1,154 @@
+from jag.dfs import DepthFirstSearch
+from jag.graph import Graph
+
+
+# noinspection PyShadowingBuiltins
+class IncrementalTopologicalOrder:
+    """Maintain a topological order of a graph while edges are created.
+
+    The algorithm of Pearce and Kelly. Each node holds a position. An edge
+    that already points forward costs one comparison. An edge that points
+    backward is repaired by searching forward from its head and backward
+    from its tail, only through the nodes between the two positions, and
+    by handing the positions of the found nodes around among themselves.
+    The cost is proportional to this affected region, not to the graph.
+
+    The order follows the graph through its signals *node_created*,
+    *edge_created*, *edge_removed* and *node_removed*. An edge that closes a cycle is
+    removed again and `Graph.CycleInDAG` is raised from the call that
+    created it, with the cycle in attribute *cycle*.
+
+    If the edge closing the cycle was created by `Graph.add_edges_from`,
+    the edges of the same batch after it are kept, but not ordered. The
+    order is stale then and raises Stale until *rebuild* is called.
+    """
+
+    CycleInDAG = DepthFirstSearch.CycleInDAG
+
+    class Stale(Graph.Error):
+        pass
+
+    def __init__(self, graph: Graph):
+        """Order the graph and follow its changes.
+
+        Raises Graph.CycleInDAG if the graph has a cycle.
+
+        :param graph: The graph to follow.
+        """
+        self._graph = graph
+        """Node to position. Positions ascend along the order, with gaps
+        after removals."""
+        self._position = {}
+        """The position of the next new node."""
+        self._end = 0
+        """Count of the ordered edges."""
+        self._count = 0
+        """Edges of the graph are not ordered."""
+        self._stale = False
+        self.rebuild()
+        graph.slot('node_created', self._append)
+        graph.slot('edge_created', self._insert)
+        graph.slot('edge_removed', self._remove)
+        graph.slot('node_removed', self._position.pop)
+
+    def rebuild(self):
+        """Order the graph from scratch.
+
+        Raises Graph.CycleInDAG if the graph has a cycle.
+        """
+        order = self._graph.topological_order()
+        self._position.clear()
+        self._position.update(zip(order, range(len(order))))
+        self._end = len(order)
+        self._count = len(self._graph.edges)
+        self._stale = False
+
+    def order(self):
+        """Return the nodes in topological order.
+
+        Raises Stale if edges are not ordered, see *rebuild*.
+
+        :return: List of ID's.
+        """
+        self._check()
+        return sorted(self._position, key=self._position.__getitem__)
+
+    def precedes(self, a, b):
+        """Check if a node comes before another one in the order.
+
+        Raises Stale if edges are not ordered, see *rebuild*.
+
+        :param a: ID of node.
+        :param b: ID of node.
+        :return: Boolean.
+        """
+        self._check()
+        return self._position[a] < self._position[b]
+
+    def _check(self):
+        if self._stale:
+            raise self.Stale('Edges are not ordered after a cycle, '
+                             'rebuild the order.')
+
+    def _append(self, id):
+        self._position[id] = self._end
+        self._end += 1
+
+    def _remove(self, tail, head):
+        self._count -= 1
+
+    def _insert(self, tail, head):
+        self._check()
+        self._count += 1
+        position = self._position
+        lower, upper = position[head], position[tail]
+        if lower > upper:
+            return
+        if tail == head:
+            self._reject(tail, head, [tail, tail])
+        forward = self._forward(tail, head, upper)
+        backward = self._backward(tail, lower)
+        nodes = sorted(backward, key=position.__getitem__)
+        nodes.extend(sorted(forward, key=position.__getitem__))
+        position.update(zip(nodes, sorted(map(position.__getitem__, nodes))))
+
+    def _forward(self, tail, head, upper):
+        """Collect the nodes reachable from head before tail, the parent
+        of each node as value."""
+        position = self._position
+        successors = self._graph.successors
+        parent = {head: None}
+        stack = [head]
+        while stack:
+            node = stack.pop()
+            for child in successors(node):
+                if child == tail:
+                    path = [node]
+                    while parent[path[-1]] is not None:
+                        path.append(parent[path[-1]])
+                    self._reject(tail, head, [tail] + path[::-1] + [tail])
+                if child not in parent and position[child] < upper:
+                    parent[child] = node
+                    stack.append(child)
+        return parent
+
+    def _backward(self, tail, lower):
+        """Collect the nodes reaching tail after head."""
+        position = self._position
+        predecessors = self._graph.predecessors
+        found = {tail}
+        stack = [tail]
+        while stack:
+            for parent in predecessors(stack.pop()):
+                if parent not in found and position[parent] > lower:
+                    found.add(parent)
+                    stack.append(parent)
+        return found
+
+    def _reject(self, tail, head, cycle):
+        self._graph.remove_edge(tail, head)
+        if self._count != len(self._graph.edges):
+            self._stale = True
+        msg = 'Edge ({}, {}) closes a cycle: {}.'.format(
+            tail, head, ' -> '.join(map(str, cycle)))
+        raise self.CycleInDAG(msg, cycle)
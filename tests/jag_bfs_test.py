@@ -0,0 +1,74 @@
+from unittest import TestCase
+
+from jag import BreadthFirstSearch
+from jag import Graph
+from jag.signalslot import SignalSlot
+
+
+class BreadthFirstSearchTest(TestCase):
+    def setUp(self):
+        self.graph = Graph()
+        edges = ((0, 1), (0, 2), (1, 3), (2, 3), (3, 4), (4, 0), (5, 0))
+        self.graph.add_edges_from(edges)
+        self.bfs = BreadthFirstSearch(self.graph)
+        self.expect = [[0], [1, 2], [3], [4]]
+
+    def sorted_levels(self, bfs, root=0):
+        return [sorted(frontier) for frontier in bfs.levels(root)]
+
+    def test___init__(self):
+        self.assertIs(self.graph, self.bfs._graph)
+        self.assertIsInstance(self.bfs, SignalSlot)
+
+    def test_levels(self):
+        self.assertEqual(self.expect, self.sorted_levels(self.bfs))
+
+    def test_levels_raises_NodeMissing(self):
+        with self.assertRaises(Graph.NodeMissing):
+            list(self.bfs.levels(10))
+
+    def test_levels_frozen(self):
+        bfs = BreadthFirstSearch(self.graph.freeze())
+        self.assertEqual(self.expect, self.sorted_levels(bfs))
+
+    def test_levels_direction_optimizing(self):
+        for graph in (self.graph, self.graph.freeze()):
+            bfs = BreadthFirstSearch(graph, direction_optimizing=True)
+            self.assertEqual(self.expect, self.sorted_levels(bfs))
+
+    def test_levels_direction_optimizing_switches(self):
+        graph = Graph()
+        graph.add_edges_from((0, i) for i in range(1, 50))
+        graph.add_edges_from((i, 50 + i % 10) for i in range(1, 50))
+        graph.add_edges_from((50 + i, 60 + i) for i in range(10))
+        graph.add_edges_from((100 + i, 101 + i) for i in range(10))
+        plain = self.sorted_levels(BreadthFirstSearch(graph))
+        bfs = BreadthFirstSearch(graph, direction_optimizing=True)
+        self.assertEqual(plain, self.sorted_levels(bfs))
+        self.assertEqual([1, 49, 10, 10], [len(level) for level in plain])
+
+    def test_distances(self):
+        expect = {0: 0, 1: 1, 2: 1, 3: 2, 4: 3}
+        self.assertEqual(expect, self.bfs.distances(0))
+        self.assertEqual({4: 0, 0: 1, 1: 2, 2: 2, 3: 3},
+                         self.bfs.distances(4))
+
+    def test_parse_signals(self):
+        levels, visits = [], []
+        self.bfs.slot('level', lambda depth, frontier: levels.append(
+            (depth, sorted(frontier))))
+        self.bfs.slot('visit', lambda node, depth: visits.append(
+            (node, depth)))
+        self.bfs.parse(0)
+        self.assertEqual(list(enumerate(self.expect)), levels)
+        self.assertCountEqual([(0, 0), (1, 1), (2, 1), (3, 2), (4, 3)], visits)
+
+    def test_parse_overridden_hook(self):
+        visits = {}
+
+        class Search(BreadthFirstSearch):
+            def _visit(self, node, depth):
+                visits[node] = depth
+
+        Search(self.graph).parse(0)
+        self.assertEqual(self.bfs.distances(0), visits)
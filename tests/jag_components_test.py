@@ -0,0 +1,144 @@
+from array import array
+from unittest import TestCase
+
+from jag import Graph
+from jag import condensation
+from jag import UnionFind
+from jag import strongly_connected_components
+from jag import weakly_connected_components
+
+
+class StronglyConnectedComponentsTest(TestCase):
+    def setUp(self):
+        self.graph = Graph()
+        edges = (('a', 'b'), ('b', 'c'), ('c', 'a'), ('c', 'd'), ('d', 'e'),
+                 ('e', 'd'), ('e', 'f'), ('g', 'f'), ('h', 'h'))
+        self.graph.add_edges_from(edges)
+
+    def groups(self, graph, components):
+        groups = {}
+        for id, component in zip(graph.nodes, components):
+            groups.setdefault(component, set()).add(id)
+        return groups
+
+    def test_strongly_connected_components(self):
+        components = strongly_connected_components(self.graph)
+        self.assertIsInstance(components, array)
+        self.assertEqual(self.graph.count_of_nodes(), len(components))
+        groups = self.groups(self.graph, components)
+        self.assertCountEqual([{'a', 'b', 'c'}, {'d', 'e'}, {'f'}, {'g'},
+                               {'h'}], groups.values())
+        self.assertEqual(set(range(5)), set(groups))
+
+    def test_strongly_connected_components_topological(self):
+        components = dict(zip(self.graph.nodes,
+                              strongly_connected_components(self.graph)))
+        for tail, head in self.graph.edges:
+            self.assertLessEqual(components[tail], components[head])
+
+    def test_strongly_connected_components_frozen(self):
+        frozen = self.graph.freeze()
+        groups = self.groups(frozen, strongly_connected_components(frozen))
+        self.assertCountEqual([{'a', 'b', 'c'}, {'d', 'e'}, {'f'}, {'g'},
+                               {'h'}], groups.values())
+
+    def test_strongly_connected_components_deep(self):
+        graph = Graph()
+        count = 20000
+        graph.add_edges_from((i, i + 1) for i in range(count))
+        graph.create_edge(count, 0)
+        components = strongly_connected_components(graph)
+        self.assertEqual({0}, set(components))
+
+    def test_strongly_connected_components_empty(self):
+        self.assertEqual(array('q'), strongly_connected_components(Graph()))
+
+    def test_condensation(self):
+        components = strongly_connected_components(self.graph)
+        condensed = condensation(self.graph, components)
+        self.assertEqual(5, condensed.count_of_nodes())
+        self.assertEqual(3, condensed.count_of_edges())
+        members = condensed.get_node_tags('members')
+        self.assertCountEqual(['a', 'b', 'c'], members[components[0]])
+        condensed.topological_order()
+        self.assertEqual(list(range(5)), sorted(condensed.nodes))
+
+    def test_condensation_computes_components(self):
+        condensed = condensation(self.graph.freeze())
+        self.assertEqual(3, condensed.count_of_edges())
+
+
+class UnionFindTest(TestCase):
+    def setUp(self):
+        self.union_find = UnionFind([1, 2, 3, 4, 5])
+
+    def test___init__(self):
+        self.assertEqual(5, len(self.union_find))
+        self.assertEqual(5, self.union_find.count_of_components())
+        self.assertIn(3, self.union_find)
+        self.assertNotIn(6, self.union_find)
+
+    def test_add(self):
+        self.assertTrue(self.union_find.add(6))
+        self.assertFalse(self.union_find.add(6))
+        self.assertEqual(6, self.union_find.count_of_components())
+
+    def test_union(self):
+        self.assertTrue(self.union_find.union(1, 2))
+        self.assertTrue(self.union_find.union(3, 4))
+        self.assertTrue(self.union_find.union(2, 4))
+        self.assertFalse(self.union_find.union(1, 3))
+        self.assertTrue(self.union_find.connected(1, 4))
+        self.assertFalse(self.union_find.connected(1, 5))
+        self.assertEqual(self.union_find.find(1), self.union_find.find(3))
+        self.assertEqual(2, self.union_find.count_of_components())
+
+    def test_union_adds_nodes(self):
+        self.union_find.union(7, 8)
+        self.assertTrue(self.union_find.connected(7, 8))
+        self.assertEqual(6, self.union_find.count_of_components())
+
+    def test_find_raises_KeyError(self):
+        with self.assertRaises(KeyError):
+            self.union_find.find(10)
+
+    def test_labels_and_components(self):
+        self.union_find.add_edges_from([(5, 1), (2, 3)])
+        self.assertEqual(array('q', [0, 1, 1, 2, 0]), self.union_find.labels())
+        self.assertEqual([[1, 5], [2, 3], [4]], self.union_find.components())
+
+    def test_from_graph(self):
+        graph = Graph()
+        graph.add_edges_from([(1, 2), (3, 2), (4, 5)])
+        graph.create_node(6)
+        for source in (graph, graph.freeze()):
+            union_find = UnionFind.from_graph(source)
+            self.assertEqual([[1, 2, 3], [4, 5], [6]],
+                             sorted(map(sorted, union_find.components())))
+
+    def test_attach(self):
+        graph = Graph(checked=False)
+        graph.create_edge(1, 2)
+        union_find = UnionFind()
+        union_find.attach(graph)
+        self.assertTrue(union_find.connected(1, 2))
+        graph.create_edge(3, 4)
+        graph.create_node(5)
+        self.assertEqual(3, union_find.count_of_components())
+        graph.add_edges_from([(2, 3)])
+        self.assertTrue(union_find.connected(1, 4))
+        self.assertEqual(2, union_find.count_of_components())
+        checked = Graph()
+        union_find = UnionFind()
+        union_find.attach(checked)
+        checked.create_edge(1, 2)
+        self.assertTrue(union_find.connected(1, 2))
+
+    def test_weakly_connected_components(self):
+        graph = Graph()
+        graph.add_edges_from([(1, 2), (3, 2), (4, 5)])
+        graph.create_node(6)
+        components = weakly_connected_components(graph)
+        self.assertIsInstance(components, array)
+        result = dict(zip(graph.nodes, components))
+        self.assertEqual({1: 0, 2: 0, 3: 0, 4: 1, 5: 1, 6: 2}, result)
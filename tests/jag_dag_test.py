@@ -0,0 +1,71 @@
+from math import inf
+from unittest import TestCase
+
+from jag import Graph
+from jag import dag_longest_path
+from jag import dag_shortest_path
+
+
+class DagTest(TestCase):
+    def setUp(self):
+        self.graph = Graph()
+        edges = (('a', 'b', 2), ('a', 'c', 1), ('b', 'd', 1), ('c', 'd', 5),
+                 ('d', 'e', 1), ('a', 'e', 4))
+        for tail, head, weight in edges:
+            self.graph.create_edge(tail, head)
+            self.graph.tag_edge(tail, head, 'weight', weight)
+        self.graph.create_node('f')
+
+    def test_topological_order(self):
+        order = self.graph.topological_order()
+        self.assertCountEqual(self.graph.nodes, order)
+        position = {id: i for i, id in enumerate(order)}
+        for tail, head in self.graph.edges:
+            self.assertLess(position[tail], position[head])
+
+    def test_topological_order_raises_CycleInDAG(self):
+        self.graph.create_edge('e', 'c')
+        with self.assertRaises(Graph.CycleInDAG) as raised:
+            self.graph.topological_order()
+        result = str(raised.exception)
+        expect = 'Cycle detected, 3 of 6 nodes are not ordered.'
+        self.assertEqual(expect, result)
+
+    def test_dag_longest_path(self):
+        result = dag_longest_path(self.graph)
+        self.assertEqual((7, ['a', 'c', 'd', 'e']), result)
+
+    def test_dag_longest_path_default_weight(self):
+        result = dag_longest_path(self.graph, 'missing')
+        self.assertEqual(3, result[0])
+        self.assertEqual(4, len(result[1]))
+
+    def test_dag_longest_path_negative_weight(self):
+        graph = Graph()
+        graph.create_edge(1, 2)
+        graph.create_edge(2, 3)
+        graph.tag_edge(1, 2, 'weight', -5)
+        graph.tag_edge(2, 3, 'weight', 2)
+        self.assertEqual((2, [2, 3]), dag_longest_path(graph))
+
+    def test_dag_longest_path_empty(self):
+        self.assertEqual((0, []), dag_longest_path(Graph()))
+
+    def test_dag_longest_path_raises_CycleInDAG(self):
+        self.graph.create_edge('e', 'a')
+        with self.assertRaises(Graph.CycleInDAG):
+            dag_longest_path(self.graph)
+
+    def test_dag_shortest_path(self):
+        result = dag_shortest_path(self.graph, 'a', 'd')
+        self.assertEqual((3, ['a', 'b', 'd']), result)
+        result = dag_shortest_path(self.graph, 'a', 'e')
+        self.assertEqual((4, ['a', 'e']), result)
+
+    def test_dag_shortest_path_unreachable(self):
+        result = dag_shortest_path(self.graph, 'b', 'c')
+        self.assertEqual((inf, []), result)
+
+    def test_dag_shortest_path_raises_NodeMissing(self):
+        with self.assertRaises(Graph.NodeMissing):
+            dag_shortest_path(self.graph, 'a', 'x')
@@ -0,0 +1,50 @@
+from unittest import TestCase
+
+from jag import Graph
+from jag import de_bruijn_graph, decode_kmer, encode_kmer
+
+
+class DeBruijnTest(TestCase):
+    def test_encode_kmer(self):
+        self.assertEqual(0, encode_kmer('AAA'))
+        self.assertEqual(0b00011011, encode_kmer('ACGT'))
+        self.assertEqual(encode_kmer('ACGT'), encode_kmer('acgt'))
+
+    def test_encode_kmer_raises(self):
+        for kmer in ('ACNT', '', '0123'):
+            with self.assertRaises(ValueError):
+                encode_kmer(kmer)
+
+    def test_decode_kmer(self):
+        self.assertEqual('ACGT', decode_kmer(encode_kmer('ACGT'), 4))
+        self.assertEqual('AAC', decode_kmer(1, 3))
+
+    def test_de_bruijn_graph(self):
+        graph = de_bruijn_graph(['GAGG', 'CAGG', 'GGGG', 'GGGA', 'CAGG',
+                                 'AGGG', 'GGAG'], 4)
+        self.assertTrue(graph._multigraph)
+        labels = {decode_kmer(id, 3) for id in graph.nodes}
+        self.assertEqual({'GAG', 'AGG', 'CAG', 'GGG', 'GGA'}, labels)
+        self.assertEqual(7, graph.count_of_edges())
+        self.assertEqual(2, graph.multiplicity(encode_kmer('CAG'),
+                                               encode_kmer('AGG')))
+
+    def test_de_bruijn_graph_reads(self):
+        graph = de_bruijn_graph(['TAATGCCATGGGATGTT'], 3, chunk_size=4)
+        edges = [(decode_kmer(tail, 2), decode_kmer(head, 2))
+                 for tail, head in graph.iter_edges()]
+        self.assertIn(('AT', 'TG'), edges)
+        self.assertEqual(3, graph.multiplicity(encode_kmer('AT'),
+                                               encode_kmer('TG')))
+        self.assertEqual(15, graph.count_of_edges())
+
+    def test_de_bruijn_graph_skips_unknown_bases(self):
+        graph = de_bruijn_graph(['ACGNTTA', 'AC0GT'], 3,
+                                Graph(multigraph=True))
+        edges = [(decode_kmer(tail, 2), decode_kmer(head, 2))
+                 for tail, head in graph.iter_edges()]
+        self.assertCountEqual([('AC', 'CG'), ('TT', 'TA')], edges)
+
+    def test_de_bruijn_graph_raises_k(self):
+        with self.assertRaises(ValueError):
+            de_bruijn_graph(['ACGT'], 1)
@@ -32,11 +32,49 @@ class DepthFirstSearchTest(TestCase):
 
     def test__dfs_raises_CycleInDAG(self):
         self.graph.create_edge(10, 20)
-        self.graph.create_edge(10, 30)
         self.graph.create_edge(20, 30)
-        with self.assertRaises(self.dfs.CycleInDAG):
+        self.graph.create_edge(30, 20)
+        with self.assertRaises(self.dfs.CycleInDAG) as raised:
             self.dfs._dfs(10, set())
-            # TODO check message
+        result = str(raised.exception)
+        expect = 'Unexpected cycle detected at node 20: 20 -> 30 -> 20.'
+        self.assertEqual(expect, result)
+        self.assertEqual([20, 30, 20], raised.exception.cycle)
+
+    def test__dfs_raises_CycleInDAG_self_loop(self):
+        self.graph.create_edge(10, 10)
+        with self.assertRaises(self.dfs.CycleInDAG) as raised:
+            self.dfs.parse(10)
+        self.assertEqual([10, 10], raised.exception.cycle)
+
+    def test__dfs_diamond_visits_shared_node_once(self):
+        for edge in ((1, 2), (1, 3), (2, 4), (3, 4), (4, 5)):
+            self.graph.create_edge(*edge)
+        entries, exits = [], []
+        self.dfs.slot('entry', entries.append)
+        self.dfs.slot('exit', exits.append)
+        self.dfs.parse(1)
+        self.assertCountEqual([1, 2, 3, 4, 5], entries)
+        self.assertCountEqual([1, 2, 3, 4, 5], exits)
+        self.assertEqual(1, exits[-1])
+        self.assertLess(exits.index(5), exits.index(4))
+
+    def test__dfs_revisit_reenters_shared_node(self):
+        for edge in ((1, 2), (1, 3), (2, 4), (3, 4)):
+            self.graph.create_edge(*edge)
+        dfs = DepthFirstSearch(self.graph, revisit=True)
+        leafs = []
+        dfs.slot('leaf', leafs.append)
+        dfs.parse(1)
+        self.assertEqual([4, 4], leafs)
+
+    def test__dfs_revisit_raises_CycleInDAG(self):
+        for edge in ((1, 2), (2, 3), (3, 1)):
+            self.graph.create_edge(*edge)
+        dfs = DepthFirstSearch(self.graph, revisit=True)
+        with self.assertRaises(dfs.CycleInDAG) as raised:
+            dfs.parse(1)
+        self.assertEqual([1, 2, 3, 1], raised.exception.cycle)
 
     def test__dfs(self):
         ns = SimpleNamespace()
@@ -81,3 +119,85 @@ class DepthFirstSearchTest(TestCase):
         self.dfs.slot('exit', self.method)
         self.dfs._exit(10)
         self.assertEqual(10, self.method_arguments[0])
+
+    def test__dfs_deep_path(self):
+        count = 20000
+        self.graph.add_edges_from((i, i + 1) for i in range(count))
+        ns = SimpleNamespace(entries=[], exits=[])
+        self.dfs.slot('entry', ns.entries.append)
+        self.dfs.slot('exit', ns.exits.append)
+        self.dfs.parse(0)
+        self.assertEqual(list(range(count + 1)), ns.entries)
+        self.assertEqual(list(range(count, -1, -1)), ns.exits)
+
+    def test_CycleInDAG_is_Graph_CycleInDAG(self):
+        self.assertTrue(issubclass(self.dfs.CycleInDAG, Graph.CycleInDAG))
+
+    def test__hook(self):
+        self.assertIsNone(self.dfs._hook('entry'))
+        self.dfs.slot('entry', self.method)
+        self.assertIs(self.method, self.dfs._hook('entry'))
+
+    def test__hook_overridden(self):
+        class Search(DepthFirstSearch):
+            def _leaf(self, node):
+                pass
+
+        dfs = Search(self.graph)
+        self.assertEqual(dfs._leaf, dfs._hook('leaf'))
+        self.assertIsNone(dfs._hook('exit'))
+
+    def test__dfs_calls_overridden_hooks(self):
+        events = []
+
+        class Search(DepthFirstSearch):
+            def _entry(self, node):
+                events.append(('entry', node))
+
+            def _exit(self, node):
+                events.append(('exit', node))
+
+        self.graph.create_edge(1, 2)
+        dfs = Search(self.graph)
+        dfs.slot('leaf', lambda node: events.append(('leaf', node)))
+        dfs.parse(1)
+        expect = [('entry', 1), ('entry', 2), ('leaf', 2), ('exit', 2),
+                  ('exit', 1)]
+        self.assertEqual(expect, events)
+
+    def _tree(self):
+        for edge in ((0, 1), (0, 2), (0, 3), (2, 4), (2, 5)):
+            self.graph.create_edge(*edge)
+
+    def test_events(self):
+        self._tree()
+        signals = []
+        for kind in ('entry', 'leaf', 'exit'):
+            self.dfs.slot(kind, lambda node, k=kind: signals.append((k, node)))
+        self.dfs.parse(0)
+        self.assertEqual(signals, list(self.dfs.events(0)))
+
+    def test_events_is_lazy(self):
+        self._tree()
+        events = self.dfs.events(0)
+        self.assertEqual(('entry', 0), next(events))
+        self.assertEqual(('entry', 1), next(events))
+
+    def test_events_raises_CycleInDAG(self):
+        self.graph.create_edge(1, 2)
+        self.graph.create_edge(2, 1)
+        with self.assertRaises(self.dfs.CycleInDAG) as raised:
+            list(self.dfs.events(1))
+        self.assertEqual([1, 2, 1], raised.exception.cycle)
+
+    def test_preorder(self):
+        self._tree()
+        self.assertEqual([0, 1, 2, 4, 5, 3], list(self.dfs.preorder(0)))
+
+    def test_postorder(self):
+        self._tree()
+        self.assertEqual([1, 4, 5, 2, 3, 0], list(self.dfs.postorder(0)))
+
+    def test_leaves(self):
+        self._tree()
+        self.assertEqual([1, 4, 5, 3], list(self.dfs.leaves(0)))
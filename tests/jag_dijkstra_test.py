@@ -0,0 +1,98 @@
+from math import inf
+from unittest import TestCase
+
+from jag import Graph
+from jag import astar
+from jag import bidirectional_dijkstra
+from jag import dijkstra
+from jag import dijkstra_path
+
+
+class DijkstraTest(TestCase):
+    def setUp(self):
+        self.graph = Graph()
+        edges = (('a', 'b', 7), ('a', 'c', 9), ('a', 'f', 14), ('b', 'c', 10),
+                 ('b', 'd', 15), ('c', 'd', 11), ('c', 'f', 2), ('d', 'e', 6),
+                 ('f', 'e', 9), ('e', 'a', 1))
+        self.graph.add_edges_from((tail, head) for tail, head, _ in edges)
+        self.graph.set_edge_tags('weight', {(tail, head): weight
+                                            for tail, head, weight in edges})
+        self.graph.create_node('g')
+        self.distances = {'a': 0, 'b': 7, 'c': 9, 'd': 20, 'e': 20, 'f': 11}
+
+    def test_dijkstra(self):
+        distance, predecessor = dijkstra(self.graph, 'a')
+        self.assertEqual(self.distances, distance)
+        self.assertEqual('f', predecessor['e'])
+        self.assertEqual('c', predecessor['f'])
+
+    def test_dijkstra_default_weight(self):
+        distance, _ = dijkstra(self.graph, 'a', weight_tag='missing')
+        self.assertEqual({'a': 0, 'b': 1, 'c': 1, 'd': 2, 'e': 2, 'f': 1},
+                         distance)
+
+    def test_dijkstra_targets(self):
+        distance, _ = dijkstra(self.graph, 'a', targets=['b', 'c'])
+        self.assertEqual({'a': 0, 'b': 7, 'c': 9}, distance)
+
+    def test_dijkstra_frozen(self):
+        distance, _ = dijkstra(self.graph.freeze(), 'a')
+        self.assertEqual(self.distances, distance)
+
+    def test_dijkstra_raises_NodeMissing(self):
+        with self.assertRaises(Graph.NodeMissing):
+            dijkstra(self.graph, 'x')
+
+    def test_dijkstra_raises_ValueError(self):
+        self.graph.tag_edge('a', 'b', 'weight', -1)
+        with self.assertRaises(ValueError) as raised:
+            dijkstra(self.graph, 'a')
+        self.assertEqual('Negative weight in tag weight.',
+                         str(raised.exception))
+
+    def test_dijkstra_ignores_weights_not_searched(self):
+        self.graph.create_edge('g', 'a')
+        self.graph.tag_edge('g', 'a', 'weight', -1)
+        self.assertEqual(self.distances, dijkstra(self.graph, 'a')[0])
+
+    def test_dijkstra_path(self):
+        result = dijkstra_path(self.graph, 'a', 'e')
+        self.assertEqual((20, ['a', 'c', 'f', 'e']), result)
+        self.assertEqual((inf, []), dijkstra_path(self.graph, 'a', 'g'))
+
+    def test_bidirectional_dijkstra(self):
+        for target, expect in self.distances.items():
+            length, path = bidirectional_dijkstra(self.graph, 'a', target)
+            self.assertEqual(expect, length)
+            self.assertEqual('a', path[0])
+            self.assertEqual(target, path[-1])
+        result = bidirectional_dijkstra(self.graph, 'b', 'f')
+        self.assertEqual((12, ['b', 'c', 'f']), result)
+
+    def test_bidirectional_dijkstra_unreachable(self):
+        self.assertEqual((inf, []),
+                         bidirectional_dijkstra(self.graph, 'a', 'g'))
+
+    def test_astar(self):
+        def zero(node, target):
+            return 0
+
+        result = astar(self.graph, 'a', 'e', zero)
+        self.assertEqual((20, ['a', 'c', 'f', 'e']), result)
+        self.assertEqual((inf, []), astar(self.graph, 'a', 'g', zero))
+
+    def test_astar_grid(self):
+        graph = Graph()
+        for x in range(5):
+            for y in range(5):
+                if x < 4:
+                    graph.create_edge((x, y), (x + 1, y))
+                if y < 4:
+                    graph.create_edge((x, y), (x, y + 1))
+
+        def manhattan(node, target):
+            return abs(node[0] - target[0]) + abs(node[1] - target[1])
+
+        length, path = astar(graph, (0, 0), (4, 3), manhattan)
+        self.assertEqual(7, length)
+        self.assertEqual(8, len(path))
@@ -0,0 +1,86 @@
+from unittest import TestCase
+
+from jag import Graph
+from jag import NotEulerian
+from jag import eulerian_cycle
+from jag import eulerian_path
+
+
+class EulerTest(TestCase):
+    def setUp(self):
+        self.graph = Graph()
+
+    def assertWalksEdges(self, path, edges):
+        self.assertCountEqual(edges, list(zip(path, path[1:])))
+
+    def test_eulerian_cycle(self):
+        edges = [(0, 3), (1, 0), (2, 1), (2, 6), (3, 2), (4, 2), (5, 4),
+                 (6, 5), (6, 8), (7, 9), (8, 7), (9, 6)]
+        self.graph.add_edges_from(edges)
+        path = list(eulerian_cycle(self.graph, start=6))
+        self.assertEqual(6, path[0])
+        self.assertEqual(6, path[-1])
+        self.assertWalksEdges(path, edges)
+
+    def test_eulerian_cycle_raises_NotEulerian(self):
+        self.graph.add_edges_from([(0, 1), (1, 2)])
+        with self.assertRaises(NotEulerian) as raised:
+            list(eulerian_cycle(self.graph))
+        result = str(raised.exception)
+        expect = 'No Eulerian cycle, 2 nodes are unbalanced.'
+        self.assertEqual(expect, result)
+
+    def test_eulerian_path(self):
+        edges = [(0, 2), (1, 3), (2, 1), (3, 0), (3, 4), (6, 3), (6, 7),
+                 (7, 8), (8, 9), (9, 6)]
+        self.graph.add_edges_from(edges)
+        path = list(eulerian_path(self.graph))
+        self.assertEqual([6, 7, 8, 9, 6, 3, 0, 2, 1, 3, 4], path)
+
+    def test_eulerian_path_is_a_generator(self):
+        self.graph.add_edges_from([(0, 1), (1, 2)])
+        path = eulerian_path(self.graph)
+        self.assertEqual(0, next(path))
+        self.assertEqual([1, 2], list(path))
+
+    def test_eulerian_path_of_cycle(self):
+        self.graph.add_edges_from([(0, 1), (1, 2), (2, 0)])
+        path = list(eulerian_path(self.graph))
+        self.assertEqual(path[0], path[-1])
+        self.assertEqual(4, len(path))
+
+    def test_eulerian_path_empty(self):
+        self.graph.create_node(1)
+        self.assertEqual([], list(eulerian_path(self.graph)))
+
+    def test_eulerian_path_raises_NotEulerian_unbalanced(self):
+        self.graph.add_edges_from([(0, 1), (0, 2)])
+        with self.assertRaises(NotEulerian):
+            next(eulerian_path(self.graph))
+
+    def test_eulerian_path_raises_NotEulerian_disconnected(self):
+        self.graph.add_edges_from([(0, 1), (1, 0), (2, 3), (3, 2)])
+        with self.assertRaises(NotEulerian) as raised:
+            list(eulerian_path(self.graph))
+        result = str(raised.exception)
+        expect = 'The edges are not connected, 2 of 4 edges walked.'
+        self.assertEqual(expect, result)
+
+    def test_eulerian_path_multiplicity(self):
+        self.graph.add_edges_from([(0, 1), (1, 0), (1, 2)])
+        self.graph.tag_edge(0, 1, 'count', 2)
+        self.graph.tag_edge(1, 0, 'count', 1)
+        path = list(eulerian_path(self.graph, 'count'))
+        self.assertEqual([0, 1, 0, 1, 2], path)
+
+    def test_eulerian_path_frozen(self):
+        self.graph.add_edges_from([(0, 1), (1, 0), (1, 2)])
+        self.graph.tag_edge(0, 1, 'count', 2)
+        path = list(eulerian_path(self.graph.freeze(), 'count'))
+        self.assertEqual([0, 1, 0, 1, 2], path)
+
+    def test_eulerian_path_multigraph(self):
+        graph = Graph(multigraph=True)
+        graph.add_edges_from([(0, 1), (1, 0), (0, 1), (1, 2)])
+        self.assertEqual([0, 1, 0, 1, 2], list(eulerian_path(graph)))
+        self.assertEqual([0, 1, 0, 1, 2], list(eulerian_path(graph.freeze())))
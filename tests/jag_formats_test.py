@@ -0,0 +1,76 @@
+import io
+import os
+import tempfile
+from unittest import TestCase
+
+from jag import Graph
+from jag import read_adjacency_list, read_edge_list
+from jag import write_adjacency_list, write_edge_list
+
+
+class FormatsTest(TestCase):
+    def setUp(self):
+        self.graph = Graph(multigraph=True)
+        self.graph.add_edges_from([('A', 'B'), ('A', 'C'), ('B', 'C'),
+                                   ('B', 'C'), ('C', 'A')])
+        self.graph.create_node('D')
+
+    def _path(self, suffix):
+        descriptor, path = tempfile.mkstemp(suffix=suffix)
+        os.close(descriptor)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_read_edge_list(self):
+        text = io.StringIO('# comment\n1 2\n2 3\n\n3 1\n4\n')
+        graph = read_edge_list(text, convert=int, chunk_size=4)
+        self.assertEqual([1, 2, 3, 4], list(graph.nodes))
+        self.assertEqual([(1, 2), (2, 3), (3, 1)], list(graph.edges))
+
+    def test_read_edge_list_separator(self):
+        graph = read_edge_list(io.StringIO('a b,c\nc,a b\n'), separator=',')
+        self.assertEqual([('a b', 'c'), ('c', 'a b')], list(graph.edges))
+
+    def test_read_edge_list_raises_no_edge(self):
+        with self.assertRaises(ValueError):
+            read_edge_list(io.StringIO('1 2 3\n'))
+
+    def test_read_adjacency_list(self):
+        text = io.StringIO('0 -> 1\n1 -> 2,3\n2 -> 3,3\n3\n')
+        graph = read_adjacency_list(text, Graph(multigraph=True), int, 8)
+        self.assertEqual([0, 1, 2, 3], list(graph.nodes))
+        self.assertEqual(2, graph.multiplicity(2, 3))
+        self.assertEqual(5, graph.count_of_edges())
+
+    def test_read_adjacency_list_without_heads(self):
+        text = io.StringIO('1 -> 2\n2 -> \n3 ->,\n')
+        graph = read_adjacency_list(text, convert=int)
+        self.assertCountEqual([1, 2, 3], graph.nodes)
+        self.assertEqual([(1, 2)], list(graph.edges))
+
+    def test_write_edge_list(self):
+        text = io.StringIO()
+        write_edge_list(self.graph, text, chunk_size=4)
+        expect = 'A B\nA C\nB C\nB C\nC A\nD\n'
+        self.assertCountEqual(expect.splitlines(),
+                              text.getvalue().splitlines())
+
+    def test_write_adjacency_list(self):
+        text = io.StringIO()
+        write_adjacency_list(self.graph.freeze(), text)
+        expect = 'A -> B,C\nB -> C,C\nC -> A\nD\n'
+        self.assertEqual(expect, text.getvalue())
+
+    def test_round_trip_gzip(self):
+        for suffix, write, read in (('.txt.gz', write_edge_list,
+                                     read_edge_list),
+                                    ('.gz', write_adjacency_list,
+                                     read_adjacency_list)):
+            path = self._path(suffix)
+            write(self.graph, path)
+            with open(path, 'rb') as file:
+                self.assertEqual(b'\x1f\x8b', file.read(2))
+            graph = read(path, Graph(multigraph=True))
+            self.assertCountEqual(self.graph.nodes, graph.nodes)
+            self.assertEqual(set(self.graph.edges), set(graph.edges))
+            self.assertEqual(5, graph.count_of_edges())
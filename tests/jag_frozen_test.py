@@ -0,0 +1,190 @@
+import os
+import tempfile
+from array import array
+from unittest import TestCase
+
+from jag import FrozenGraph
+from jag import Graph
+
+
+# noinspection PyShadowingBuiltins
+class FrozenGraphTest(TestCase):
+    def setUp(self):
+        graph = Graph()
+        for edge in (('a', 'b'), ('a', 'c'), ('b', 'c'), ('c', 'a')):
+            graph.create_edge(*edge)
+        graph.create_node('d')
+        graph.tag_node('a', 'color', 'red')
+        graph.tag_edge('a', 'b', 'weight', 3)
+        self.graph = graph
+        self.frozen = graph.freeze()
+
+    def test_freeze(self):
+        self.assertIsInstance(self.frozen, FrozenGraph)
+        self.assertIsInstance(self.frozen._out_indices, array)
+        self.assertIsInstance(self.frozen._in_indices, array)
+        self.assertEqual(array('q', [0, 2, 3, 4, 4]), self.frozen._out_offsets)
+        self.assertEqual(array('q', [1, 2, 2, 0]), self.frozen._out_indices)
+
+    def test_nodes(self):
+        self.assertEqual(['a', 'b', 'c', 'd'], list(self.frozen.nodes))
+
+    def test_edges(self):
+        self.assertCountEqual(self.graph.edges, self.frozen.edges)
+
+    def test_successors(self):
+        self.assertEqual(['b', 'c'], self.frozen.successors('a'))
+        self.assertEqual([], self.frozen.successors('d'))
+
+    def test_predecessors(self):
+        self.assertEqual(['a', 'b'], self.frozen.predecessors('c'))
+        self.assertEqual([], self.frozen.predecessors('d'))
+
+    def test_incoming(self):
+        self.assertEqual([('a', 'c'), ('b', 'c')], self.frozen.incoming('c'))
+
+    def test_outgoing(self):
+        self.assertEqual([('a', 'b'), ('a', 'c')], self.frozen.outgoing('a'))
+
+    def test_counts(self):
+        self.assertEqual(4, self.frozen.count_of_nodes())
+        self.assertEqual(4, self.frozen.count_of_edges())
+
+    def test_node_exists(self):
+        self.assertTrue(self.frozen.node_exists('d'))
+        self.assertFalse(self.frozen.node_exists('x'))
+
+    def test_edge_exists(self):
+        for edge in self.graph.edges:
+            self.assertTrue(self.frozen.edge_exists(*edge))
+        self.assertFalse(self.frozen.edge_exists('b', 'a'))
+        self.assertFalse(self.frozen.edge_exists('a', 'x'))
+
+    def test_index(self):
+        self.assertEqual(2, self.frozen.index('c'))
+        with self.assertRaises(FrozenGraph.NodeMissing):
+            self.frozen.index('x')
+
+    def test_tags(self):
+        self.assertEqual('red', self.frozen.node_tag('a', 'color'))
+        self.assertEqual(3, self.frozen.edge_tag('a', 'b', 'weight'))
+        self.assertFalse(self.frozen.node_tag_exists('b', 'color'))
+        with self.assertRaises(Graph.NodeTagMissing):
+            self.frozen.node_tag('b', 'color')
+        with self.assertRaises(Graph.EdgeMissing):
+            self.frozen.edge_tag('b', 'a', 'weight')
+
+    def test_thaw(self):
+        graph = self.frozen.thaw()
+        self.assertIsInstance(graph, Graph)
+        self.assertCountEqual(self.graph.nodes, graph.nodes)
+        self.assertCountEqual(self.graph.edges, graph.edges)
+        self.assertEqual(3, graph.edge_tag('a', 'b', 'weight'))
+        self.assertEqual('red', graph.node_tag('a', 'color'))
+
+    def test_multiplicity(self):
+        graph = Graph(multigraph=True)
+        graph.add_edges_from([(1, 2), (1, 2), (2, 1)])
+        frozen = graph.freeze()
+        self.assertEqual(2, frozen.multiplicity(1, 2))
+        self.assertEqual(1, frozen.multiplicity(2, 1))
+        self.assertEqual(3, frozen.count_of_edges())
+        self.assertEqual([(1, 2), (1, 2)], frozen.outgoing(1))
+        thawed = frozen.thaw()
+        self.assertEqual(2, thawed.multiplicity(1, 2))
+        self.assertEqual(3, thawed.count_of_edges())
+
+    def test_edges_view(self):
+        edges = self.frozen.edges
+        self.assertEqual(4, len(edges))
+        self.assertIn(('a', 'b'), edges)
+        self.assertNotIn(('b', 'a'), edges)
+        self.assertNotIn('a', edges)
+        self.assertEqual(set(self.graph.edges), edges)
+
+    def test_iter_nodes(self):
+        self.assertEqual(['a', 'b', 'c', 'd'], list(self.frozen.iter_nodes()))
+
+    def test_iter_edges(self):
+        self.assertEqual([('a', 'b'), ('a', 'c'), ('b', 'c'), ('c', 'a')],
+                         list(self.frozen.iter_edges()))
+
+    def test_get_tags(self):
+        self.assertEqual({'a': 'red'}, self.frozen.get_node_tags('color'))
+        self.assertEqual({('a', 'b'): 3}, self.frozen.get_edge_tags('weight'))
+        self.assertEqual({}, self.frozen.get_edge_tags('missing'))
+
+    def test_degrees(self):
+        self.assertEqual(2, self.frozen.out_degree('a'))
+        self.assertEqual(2, self.frozen.in_degree('c'))
+        self.assertEqual(self.graph.degrees(), self.frozen.degrees())
+        self.assertEqual(['d'], self.frozen.sources())
+        self.assertEqual(['d'], self.frozen.sinks())
+        graph = Graph(multigraph=True)
+        graph.add_edges_from([(1, 2), (1, 2), (2, 1)])
+        frozen = graph.freeze()
+        self.assertEqual(2, frozen.out_degree(1))
+        self.assertEqual(graph.degrees(), frozen.degrees())
+
+    def _path(self):
+        descriptor, path = tempfile.mkstemp(suffix='.jag')
+        os.close(descriptor)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_save_load(self):
+        path = self._path()
+        self.frozen.save(path)
+        for mapped in (True, False):
+            loaded = FrozenGraph.load(path, mapped)
+            self.assertEqual(['a', 'b', 'c', 'd'], list(loaded.nodes))
+            self.assertEqual(list(self.frozen.iter_edges()),
+                             list(loaded.iter_edges()))
+            self.assertEqual(['a', 'b'], loaded.predecessors('c'))
+            self.assertEqual('red', loaded.node_tag('a', 'color'))
+            self.assertEqual(3, loaded.edge_tag('a', 'b', 'weight'))
+
+    def test_save_load_integer_ids(self):
+        graph = Graph(multigraph=True)
+        graph.add_edges_from([(10, 20), (10, 20), (20, 30), (-5, 10)])
+        path = self._path()
+        graph.save(path)
+        loaded = FrozenGraph.load(path)
+        self.assertIsInstance(loaded._ids, memoryview)
+        self.assertIsInstance(loaded._out_indices, memoryview)
+        self.assertEqual([10, 20, -5, 30], list(loaded.nodes))
+        self.assertEqual(2, loaded.multiplicity(10, 20))
+        self.assertEqual(4, loaded.count_of_edges())
+        self.assertTrue(loaded.edge_exists(-5, 10))
+        thawed = Graph.load(path)
+        self.assertIsInstance(thawed, Graph)
+        self.assertEqual(set(graph.edges), set(thawed.edges))
+        self.assertEqual(4, thawed.count_of_edges())
+
+    def test_load_raises_no_snapshot(self):
+        path = self._path()
+        with open(path, 'wb') as file:
+            file.write(b'a -> b')
+        with self.assertRaises(ValueError):
+            FrozenGraph.load(path)
+
+    def test_subgraph(self):
+        subgraph = self.frozen.subgraph(['c', 'a'])
+        self.assertEqual(['c', 'a'], list(subgraph.nodes))
+        self.assertEqual([('c', 'a'), ('a', 'c')], list(subgraph.iter_edges()))
+        self.assertEqual({'a': 'red'}, subgraph.get_node_tags('color'))
+        self.assertEqual({}, subgraph.get_edge_tags('weight'))
+        self.assertEqual(3, self.frozen.subgraph('ab').edge_tag('a', 'b',
+                                                                'weight'))
+
+    def test_multigraph_round_trip(self):
+        graph = Graph(multigraph=True)
+        graph.add_edges_from([(1, 2)])
+        path = self._path()
+        graph.save(path)
+        for thawed in (graph.freeze().thaw(), Graph.load(path),
+                       FrozenGraph.load(path).thaw()):
+            self.assertTrue(thawed._multigraph)
+            thawed.create_edge(1, 2)
+            self.assertEqual(2, thawed.count_of_edges())
+        self.assertFalse(self.frozen.thaw()._multigraph)
@@ -1,3 +1,4 @@
+from collections.abc import Collection, Set
 from unittest import TestCase
 from types import SimpleNamespace
 from jag import Graph
@@ -110,7 +111,7 @@ class GraphTest(TestCase):
     def test_node_tag_exists_true(self):
         name, id = 'aa', 10
         self.graph.create_node(10)
-        self.graph._nodes[id][name] = True
+        self.graph._node_tags[name] = {id: True}
         result = self.graph.node_tag_exists(id, name)
         self.assertTrue(result)
 
@@ -130,7 +131,7 @@ class GraphTest(TestCase):
     def test_edge_tag_exists_true(self):
         tail, head, name = 10, 20, 'aa'
         self.graph.create_edge(tail, head)
-        self.graph._edges[(tail, head)][name] = True
+        self.graph._edge_tags[name] = {(tail, head): True}
         result = self.graph.edge_tag_exists(tail, head, name)
         self.assertTrue(result)
 
@@ -206,14 +207,14 @@ class GraphTest(TestCase):
         id, name, value = 10, 'aa', 'vv'
         self.graph.create_node(id)
         self.graph.tag_node(id, name, value)
-        result = self.graph._nodes[id][name]
+        result = self.graph._node_tags[name][id]
         self.assertEqual(value, result)
 
     def test_tag_node_value_default(self):
         id, name, value = 10, 'aa', True
         self.graph.create_node(id)
         self.graph.tag_node(id, name)
-        result = self.graph._nodes[id][name]
+        result = self.graph._node_tags[name][id]
         self.assertEqual(value, result)
 
     def test_untag_node(self):
@@ -260,14 +261,14 @@ class GraphTest(TestCase):
         tail, head, name, value = 10, 20, 'aa', 'vv'
         self.graph.create_edge(tail, head)
         self.graph.tag_edge(tail, head, name, value)
-        result = self.graph._edges[(tail, head)][name]
+        result = self.graph._edge_tags[name][(tail, head)]
         self.assertEqual(value, result)
 
     def test_tag_edge_value_default(self):
         tail, head, name, value = 10, 20, 'aa', True
         self.graph.create_edge(tail, head)
         self.graph.tag_edge(tail, head, name)
-        result = self.graph._edges[(tail, head)][name]
+        result = self.graph._edge_tags[name][(tail, head)]
         self.assertEqual(value, result)
 
     def test_untag_edge(self):
@@ -386,3 +387,380 @@ class GraphTest(TestCase):
         self.graph.create_edge(1, 2)
         self.graph.create_edge(1, 3)
         self.assertEqual(2, self.graph.count_of_edges())
+
+    def test_create_node_unchecked(self):
+        graph = Graph(checked=False)
+        self.assertTrue(graph.create_node(23))
+        self.assertFalse(graph.create_node(23))
+        self.assertTrue(graph.node_exists(23))
+
+    def test_create_edge_unchecked(self):
+        graph = Graph(checked=False)
+        self.assertTrue(graph.create_edge(1, 2))
+        self.assertFalse(graph.create_edge(1, 2))
+        self.assertTrue(graph.create_edge(2, 2))
+        self.assertTrue(graph.create_edge(3, 1))
+        self.assertTrue(graph.edge_exists(1, 2))
+        self.assertTrue(graph.edge_exists(2, 2))
+        self.assertEqual({2}, graph.successors(1))
+        self.assertEqual({1, 2}, graph.predecessors(2))
+        self.assertEqual({3}, graph.predecessors(1))
+        self.assertEqual(3, graph.count_of_nodes())
+        self.assertEqual(3, graph.count_of_edges())
+
+    def test_create_edge_unchecked_skips_edge_exists(self):
+        graph = Graph(checked=False)
+
+        def edge_exists(t, h):
+            self.fail('edge_exists called')
+
+        graph.edge_exists = edge_exists
+        graph.create_edge(10, 20)
+        self.assertIn((10, 20), graph._edges)
+
+    def test_unchecked(self):
+        with self.graph.unchecked() as graph:
+            self.assertIs(self.graph, graph)
+            self.assertFalse(graph._checked)
+            graph.create_edge(1, 2)
+        self.assertTrue(self.graph._checked)
+        self.assertTrue(self.graph.edge_exists(1, 2))
+
+    def test_add_nodes_from(self):
+        self.graph.create_node(1)
+        result = self.graph.add_nodes_from([1, 2, 3, 3])
+        self.assertEqual(2, result)
+        self.assertCountEqual([1, 2, 3], list(self.graph.nodes))
+        for id in (1, 2, 3):
+            self.assertTrue(self.graph.node_exists(id))
+
+    def test_add_edges_from_pairs(self):
+        self.graph.create_edge(1, 2)
+        result = self.graph.add_edges_from(
+            iter([(1, 2), (1, 3), (2, 3), (3, 1), (1, 3), (4, 4)]))
+        self.assertEqual(4, result)
+        self.assertCountEqual([(1, 2), (1, 3), (2, 3), (3, 1), (4, 4)],
+                              list(self.graph.edges))
+        self.assertEqual({2, 3}, self.graph.successors(1))
+        self.assertEqual({1, 2}, self.graph.predecessors(3))
+        self.assertEqual({4}, self.graph.predecessors(4))
+        for edge in self.graph.edges:
+            self.assertTrue(self.graph.edge_exists(*edge))
+
+    def test_add_edges_from_columns(self):
+        from array import array
+        tails, heads = array('l', [1, 1, 2]), array('l', [2, 3, 3])
+        result = self.graph.add_edges_from(tails, heads)
+        self.assertEqual(3, result)
+        self.assertCountEqual([(1, 2), (1, 3), (2, 3)],
+                              list(self.graph.edges))
+
+    def test_add_edges_from_buffer(self):
+        from array import array
+        buffer = memoryview(array('l', [1, 2, 1, 3, 2, 3]))
+        buffer = buffer.cast('B').cast('l', [3, 2])
+        result = self.graph.add_edges_from(buffer)
+        self.assertEqual(3, result)
+        self.assertCountEqual([(1, 2), (1, 3), (2, 3)],
+                              list(self.graph.edges))
+
+    def test_multigraph_create_edge(self):
+        for checked in (True, False):
+            graph = Graph(checked=checked, multigraph=True)
+            self.assertTrue(graph.create_edge(1, 2))
+            self.assertFalse(graph.create_edge(1, 2))
+            self.assertFalse(graph.create_edge(1, 2))
+            graph.create_edge(1, 3)
+            self.assertEqual(3, graph.multiplicity(1, 2))
+            self.assertEqual(1, graph.multiplicity(1, 3))
+            self.assertEqual(4, graph.count_of_edges())
+            self.assertEqual({2, 3}, graph.successors(1))
+            self.assertCountEqual([(1, 2), (1, 2), (1, 2), (1, 3)],
+                                  graph.outgoing(1))
+            self.assertCountEqual([(1, 2), (1, 2), (1, 2)], graph.incoming(2))
+
+    def test_multigraph_views(self):
+        graph = Graph(multigraph=True)
+        graph.add_edges_from([(1, 2), (1, 2), (1, 3), (3, 2)])
+        outgoing, incoming = graph.outgoing(1), graph.incoming(2)
+        self.assertNotIsInstance(outgoing, Set)
+        self.assertIsInstance(outgoing, Collection)
+        self.assertEqual(3, len(outgoing))
+        self.assertEqual(3, len(incoming))
+        self.assertIn((1, 2), outgoing)
+        self.assertNotIn((3, 2), outgoing)
+        self.assertIn((3, 2), incoming)
+        self.assertNotIn((1, 3), incoming)
+        graph.create_edge(1, 3)
+        self.assertEqual(4, len(outgoing))
+        graph.remove_edge(1, 2)
+        self.assertEqual([(1, 3), (1, 3)], list(outgoing))
+        self.assertEqual([(3, 2)], list(incoming))
+
+    def test_multigraph_add_edges_from(self):
+        graph = Graph(multigraph=True)
+        graph.create_edge(1, 2)
+        result = graph.add_edges_from([(1, 2), (2, 3), (2, 3), (2, 3)])
+        self.assertEqual(1, result)
+        self.assertEqual(2, graph.multiplicity(1, 2))
+        self.assertEqual(3, graph.multiplicity(2, 3))
+        self.assertEqual(5, graph.count_of_edges())
+
+    def test_multiplicity_simple_graph(self):
+        self.graph.create_edge(1, 2)
+        self.graph.create_edge(1, 2)
+        self.assertEqual(1, self.graph.multiplicity(1, 2))
+        self.assertEqual(1, self.graph.count_of_edges())
+
+    def test_multiplicity_raises_no_edge(self):
+        with self.assertRaises(Graph.EdgeMissing) as raised:
+            self.graph.multiplicity(1, 2)
+        result = str(raised.exception)
+        expect = 'No edge (1, 2).'
+        self.assertEqual(expect, result)
+
+    def test_nodes_is_live_view(self):
+        nodes = self.graph.nodes
+        self.graph.create_edge(1, 2)
+        self.assertEqual(2, len(nodes))
+        self.assertIn(1, nodes)
+
+    def test_edges_is_live_view(self):
+        edges = self.graph.edges
+        self.graph.create_edge(1, 2)
+        self.assertEqual(1, len(edges))
+        self.assertIn((1, 2), edges)
+
+    def test_iter_nodes(self):
+        self.graph.create_edge(1, 2)
+        self.assertEqual([1, 2], list(self.graph.iter_nodes()))
+
+    def test_iter_edges(self):
+        self.graph.create_edge(1, 2)
+        self.graph.create_edge(2, 3)
+        self.assertEqual([(1, 2), (2, 3)], list(self.graph.iter_edges()))
+
+    def test_outgoing_is_live_view(self):
+        self.graph.create_node(10)
+        outgoing = self.graph.outgoing(10)
+        self.graph.create_edge(10, 1)
+        self.graph.create_edge(2, 10)
+        self.assertEqual(1, len(outgoing))
+        self.assertIn((10, 1), outgoing)
+        self.assertNotIn((2, 10), outgoing)
+        self.assertNotIn(10, outgoing)
+        self.assertEqual([(10, 1)], list(outgoing))
+
+    def test_incoming_is_live_view(self):
+        self.graph.create_node(10)
+        incoming = self.graph.incoming(10)
+        self.graph.create_edge(10, 1)
+        self.graph.create_edge(2, 10)
+        self.assertEqual(1, len(incoming))
+        self.assertIn((2, 10), incoming)
+        self.assertNotIn((10, 1), incoming)
+        self.assertEqual([(2, 10)], list(incoming))
+
+    def test_untag_node_returns(self):
+        self.graph.create_node(10)
+        self.graph.tag_node(10, 'aa')
+        self.assertTrue(self.graph.untag_node(10, 'aa'))
+        self.assertFalse(self.graph.untag_node(10, 'aa'))
+        self.assertNotIn('aa', self.graph._node_tags)
+
+    def test_untag_edge_returns(self):
+        self.graph.create_edge(10, 20)
+        self.graph.tag_edge(10, 20, 'aa')
+        self.assertTrue(self.graph.untag_edge(10, 20, 'aa'))
+        self.assertFalse(self.graph.edge_tag_exists(10, 20, 'aa'))
+        self.assertFalse(self.graph.untag_edge(10, 20, 'aa'))
+        self.assertNotIn('aa', self.graph._edge_tags)
+
+    def test_tag_free_elements_have_no_tag_storage(self):
+        self.graph.create_edge(1, 2)
+        self.graph.add_edges_from([(2, 3)])
+        self.assertEqual({1: None, 2: None, 3: None}, self.graph._nodes)
+        self.assertEqual({(1, 2): None, (2, 3): None}, self.graph._edges)
+        self.assertEqual({}, self.graph._node_tags)
+        self.assertEqual({}, self.graph._edge_tags)
+
+    def test_get_node_tags(self):
+        self.graph.add_nodes_from([1, 2, 3])
+        self.graph.tag_node(1, 'weight', 5)
+        self.graph.tag_node(3, 'weight', 7)
+        result = self.graph.get_node_tags('weight')
+        self.assertEqual({1: 5, 3: 7}, result)
+        with self.assertRaises(TypeError):
+            result[2] = 1
+        self.assertEqual({}, self.graph.get_node_tags('missing'))
+
+    def test_set_node_tags(self):
+        self.graph.add_nodes_from([1, 2, 3])
+        self.graph.set_node_tags('weight', {1: 5, 2: 6})
+        self.graph.set_node_tags('weight', [(3, 7)])
+        self.assertEqual(6, self.graph.node_tag(2, 'weight'))
+        self.assertEqual({1: 5, 2: 6, 3: 7},
+                         self.graph.get_node_tags('weight'))
+
+    def test_set_node_tags_raises_no_node(self):
+        self.graph.create_node(1)
+        with self.assertRaises(Graph.NodeMissing) as raised:
+            self.graph.set_node_tags('weight', {1: 5, 10: 6})
+        result = str(raised.exception)
+        expect = 'No node 10.'
+        self.assertEqual(expect, result)
+        self.assertFalse(self.graph.node_tag_exists(1, 'weight'))
+
+    def test_get_edge_tags(self):
+        self.graph.add_edges_from([(1, 2), (2, 3)])
+        self.graph.tag_edge(1, 2, 'weight', 5)
+        self.assertEqual({(1, 2): 5}, self.graph.get_edge_tags('weight'))
+        self.assertEqual({}, self.graph.get_edge_tags('missing'))
+
+    def test_set_edge_tags(self):
+        self.graph.add_edges_from([(1, 2), (2, 3)])
+        self.graph.set_edge_tags('weight', {(1, 2): 5, (2, 3): 6})
+        self.assertEqual(6, self.graph.edge_tag(2, 3, 'weight'))
+
+    def test_set_edge_tags_raises_no_edge(self):
+        self.graph.create_edge(1, 2)
+        with self.assertRaises(Graph.EdgeMissing) as raised:
+            self.graph.set_edge_tags('weight', {(1, 2): 5, (2, 1): 6})
+        result = str(raised.exception)
+        expect = 'No edge (2, 1).'
+        self.assertEqual(expect, result)
+
+    def test_signals(self):
+        for checked in (True, False):
+            graph = Graph(checked=checked)
+            events = []
+            graph.slot('node_created', lambda id: events.append(id))
+            graph.slot('edge_created', lambda t, h: events.append((t, h)))
+            graph.create_node(1)
+            graph.create_edge(1, 2)
+            graph.create_edge(1, 2)
+            graph.add_nodes_from([2, 3])
+            graph.add_edges_from([(1, 2), (3, 4)])
+            self.assertEqual([1, 2, (1, 2), 3, 4, (3, 4)], events)
+
+    def test_remove_edge(self):
+        self.graph.add_edges_from([(1, 2), (2, 3)])
+        self.graph.tag_edge(1, 2, 'weight', 5)
+        self.graph.remove_edge(1, 2)
+        self.assertFalse(self.graph.edge_exists(1, 2))
+        self.assertTrue(self.graph.node_exists(1))
+        self.assertEqual(set(), self.graph.successors(1))
+        self.assertEqual(set(), self.graph.predecessors(2))
+        self.assertEqual({}, self.graph._edge_tags)
+        self.assertEqual(1, self.graph.count_of_edges())
+
+    def test_remove_edge_raises_no_edge(self):
+        with self.assertRaises(Graph.EdgeMissing) as raised:
+            self.graph.remove_edge(1, 2)
+        result = str(raised.exception)
+        expect = 'No edge (1, 2).'
+        self.assertEqual(expect, result)
+
+    def test_remove_edge_multigraph(self):
+        graph = Graph(multigraph=True)
+        graph.add_edges_from([(1, 2), (1, 2), (1, 2), (2, 3)])
+        graph.remove_edge(1, 2)
+        self.assertEqual(1, graph.count_of_edges())
+        self.assertNotIn((1, 2), graph._multiplicity)
+
+    def test_remove_edges_from(self):
+        self.graph.add_edges_from([(1, 2), (2, 3), (3, 1)])
+        result = self.graph.remove_edges_from([(1, 2), (3, 1), (5, 6)])
+        self.assertEqual(2, result)
+        self.assertEqual([(2, 3)], list(self.graph.edges))
+
+    def test_remove_node(self):
+        self.graph.add_edges_from([(1, 2), (2, 3), (3, 2), (2, 2), (4, 1)])
+        self.graph.tag_node(2, 'color', 'red')
+        self.graph.tag_edge(1, 2, 'weight', 5)
+        self.graph.remove_node(2)
+        self.assertFalse(self.graph.node_exists(2))
+        self.assertEqual([(4, 1)], list(self.graph.edges))
+        self.assertEqual(set(), self.graph.successors(1))
+        self.assertEqual(set(), self.graph.predecessors(3))
+        self.assertEqual({}, self.graph._node_tags)
+        self.assertEqual({}, self.graph._edge_tags)
+        self.assertEqual(3, self.graph.count_of_nodes())
+
+    def test_remove_node_raises_no_node(self):
+        with self.assertRaises(Graph.NodeMissing) as raised:
+            self.graph.remove_node(1)
+        result = str(raised.exception)
+        expect = 'No node 1.'
+        self.assertEqual(expect, result)
+
+    def test_remove_signals(self):
+        events = []
+        self.graph.add_edges_from([(1, 2), (2, 3)])
+        self.graph.slot('node_removed', lambda id: events.append(id))
+        self.graph.slot('edge_removed', lambda t, h: events.append((t, h)))
+        self.graph.remove_node(2)
+        self.assertEqual([(2, 3), (1, 2), 2], events)
+
+    def test_contract(self):
+        self.graph.add_edges_from([(0, 1), (1, 2), (2, 3), (3, 4), (5, 1)])
+        result = self.graph.contract([1, 2, 3], 'c')
+        self.assertEqual('c', result)
+        self.assertCountEqual([0, 'c', 4, 5], list(self.graph.nodes))
+        self.assertCountEqual([(0, 'c'), (5, 'c'), ('c', 4)],
+                              list(self.graph.edges))
+
+    def test_contract_cycle(self):
+        self.graph.add_edges_from([(1, 2), (2, 3), (3, 1)])
+        result = self.graph.contract([1, 2, 3])
+        self.assertEqual(1, result)
+        self.assertEqual([(1, 1)], list(self.graph.edges))
+
+    def test_contract_raises_no_edge(self):
+        self.graph.add_edges_from([(1, 2), (3, 4)])
+        with self.assertRaises(Graph.EdgeMissing):
+            self.graph.contract([1, 2, 3])
+        self.assertEqual(2, self.graph.count_of_edges())
+
+    def test_contract_multigraph(self):
+        graph = Graph(multigraph=True)
+        graph.add_edges_from([(0, 1), (0, 1), (0, 1), (1, 2), (2, 3),
+                              (3, 1), (3, 4), (3, 4)])
+        graph.contract([1, 2, 3])
+        self.assertEqual(3, graph.multiplicity(0, 1))
+        self.assertEqual(1, graph.multiplicity(1, 1))
+        self.assertEqual(2, graph.multiplicity(1, 4))
+        self.assertEqual(6, graph.count_of_edges())
+
+    def test_contract_loop_multigraph(self):
+        graph = Graph(multigraph=True)
+        graph.add_edges_from([(1, 1), (1, 1), (0, 1)])
+        graph.contract([1])
+        self.assertEqual(2, graph.multiplicity(1, 1))
+        self.assertEqual(3, graph.count_of_edges())
+        self.assertEqual((3, 2), (graph.in_degree(1), graph.out_degree(1)))
+
+    def test_degrees(self):
+        self.graph.add_edges_from([(1, 2), (1, 3), (2, 3), (3, 3)])
+        self.graph.create_node(4)
+        self.assertEqual(0, self.graph.in_degree(1))
+        self.assertEqual(2, self.graph.out_degree(1))
+        self.assertEqual(3, self.graph.in_degree(3))
+        in_degrees, out_degrees = self.graph.degrees()
+        self.assertEqual([0, 1, 3, 0], list(in_degrees))
+        self.assertEqual([2, 1, 1, 0], list(out_degrees))
+        self.assertEqual([1, 4], self.graph.sources())
+        self.assertEqual([4], self.graph.sinks())
+
+    def test_degrees_multigraph(self):
+        graph = Graph(multigraph=True)
+        graph.add_edges_from([(1, 2), (1, 2), (1, 2), (2, 3)])
+        self.assertEqual(3, graph.out_degree(1))
+        self.assertEqual(3, graph.in_degree(2))
+        self.assertEqual(([0, 3, 1], [3, 1, 0]),
+                         tuple(map(list, graph.degrees())))
+        graph.remove_edge(1, 2)
+        self.assertEqual(0, graph.out_degree(1))
+        self.assertEqual(0, graph.in_degree(2))
+        self.assertEqual({}, graph._out_extra)
+        self.assertEqual({}, graph._in_extra)
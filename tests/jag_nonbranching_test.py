@@ -0,0 +1,62 @@
+from unittest import TestCase
+
+from jag import Graph
+from jag import compact_nonbranching_paths
+from jag import maximal_nonbranching_paths
+
+
+class NonBranchingPathsTest(TestCase):
+    def setUp(self):
+        self.graph = Graph()
+        edges = ((1, 2), (2, 3), (3, 4), (3, 5), (6, 7), (7, 6), (8, 9),
+                 (9, 10), (10, 8), (10, 11))
+        self.graph.add_edges_from(edges)
+        self.graph.add_nodes_from([12])
+
+    def test_maximal_nonbranching_paths(self):
+        paths = list(maximal_nonbranching_paths(self.graph))
+        self.assertCountEqual([[1, 2, 3], [3, 4], [3, 5], [10, 8, 9, 10],
+                               [10, 11], [6, 7, 6]], paths)
+
+    def test_maximal_nonbranching_paths_cycle_start(self):
+        paths = list(maximal_nonbranching_paths(self.graph))
+        cycle = [path for path in paths if 6 in path][0]
+        self.assertEqual(cycle[0], cycle[-1])
+
+    def test_maximal_nonbranching_paths_frozen(self):
+        frozen = self.graph.freeze()
+        self.assertCountEqual(list(maximal_nonbranching_paths(self.graph)),
+                              list(maximal_nonbranching_paths(frozen)))
+
+    def test_maximal_nonbranching_paths_multigraph(self):
+        graph = Graph(multigraph=True)
+        graph.add_edges_from([(1, 2), (1, 2), (2, 3), (3, 4)])
+        paths = list(maximal_nonbranching_paths(graph))
+        self.assertCountEqual([[1, 2], [1, 2], [2, 3, 4]], paths)
+
+    def test_maximal_nonbranching_paths_long(self):
+        graph = Graph()
+        graph.add_edges_from((i, i + 1) for i in range(20000))
+        paths = list(maximal_nonbranching_paths(graph))
+        self.assertEqual([list(range(20001))], paths)
+
+    def test_compact_nonbranching_paths(self):
+        result = compact_nonbranching_paths(self.graph)
+        self.assertEqual(3, result)
+        self.assertCountEqual([1, 2, 3, 4, 5, 6, 8, 10, 11, 12],
+                              list(self.graph.nodes))
+        self.assertCountEqual([(1, 2), (2, 3), (3, 4), (3, 5), (6, 6),
+                               (10, 8), (8, 10), (10, 11)],
+                              list(self.graph.edges))
+        self.assertEqual([2], self.graph.node_tag(2, 'path'))
+        self.assertEqual([8, 9], self.graph.node_tag(8, 'path'))
+        self.assertCountEqual([6, 7], self.graph.node_tag(6, 'path'))
+
+    def test_compact_nonbranching_paths_multigraph_cycle(self):
+        graph = Graph(multigraph=True)
+        graph.add_edges_from([(1, 2), (2, 3), (3, 1), (4, 5), (4, 5)])
+        result = compact_nonbranching_paths(graph)
+        self.assertEqual(1, result)
+        self.assertEqual(1, graph.multiplicity(1, 1))
+        self.assertEqual(2, graph.multiplicity(4, 5))
+        self.assertEqual(3, graph.count_of_edges())
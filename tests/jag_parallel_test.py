@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+from jag import BreadthFirstSearch
+from jag import Graph
+from jag import map_components, map_roots
+from jag import maximal_nonbranching_paths
+from jag import parallel_strongly_connected_components
+
+
+def count_of_edges(graph):
+    return graph.count_of_edges()
+
+
+def nonbranching_paths(graph):
+    return sorted(maximal_nonbranching_paths(graph))
+
+
+def distances(graph, root):
+    return BreadthFirstSearch(graph).distances(root)
+
+
+class ParallelTest(TestCase):
+    def setUp(self):
+        self.graph = Graph()
+        edges = ((1, 2), (2, 3), (3, 1), (3, 4), (5, 6), (6, 7), (8, 8))
+        self.graph.add_edges_from(edges)
+        self.graph.create_node(9)
+        self.graph.tag_edge(5, 6, 'weight', 2)
+
+    def test_map_components(self):
+        for processes in (1, 2):
+            result = map_components(self.graph, count_of_edges, processes)
+            self.assertEqual([([1, 2, 3, 4], 4), ([5, 6, 7], 2), ([8], 1),
+                              ([9], 0)], result)
+
+    def test_map_components_nonbranching_paths(self):
+        result = map_components(self.graph, nonbranching_paths, 2)
+        self.assertEqual([[5, 6, 7]], result[1][1])
+
+    def test_map_roots(self):
+        result = map_roots(self.graph.freeze(), distances, [1, 5, 9], 2)
+        self.assertEqual([{1: 0, 2: 1, 3: 2, 4: 3}, {5: 0, 6: 1, 7: 2},
+                          {9: 0}], result)
+
+    def test_parallel_strongly_connected_components(self):
+        for processes in (1, 2):
+            components = dict(zip(self.graph.nodes,
+                                  parallel_strongly_connected_components(
+                                      self.graph, processes)))
+            self.assertEqual(components[1], components[2])
+            self.assertEqual(components[1], components[3])
+            self.assertEqual(7, len(set(components.values())))
+            for tail, head in self.graph.edges:
+                self.assertLessEqual(components[tail], components[head])
@@ -0,0 +1,60 @@
+import random
+from unittest import TestCase
+
+from jag import BreadthFirstSearch
+from jag import Graph
+from jag import ReachabilityIndex
+
+
+class ReachabilityIndexTest(TestCase):
+    def setUp(self):
+        self.graph = Graph()
+        edges = (('a', 'b'), ('b', 'c'), ('c', 'a'), ('c', 'd'), ('d', 'e'),
+                 ('f', 'e'), ('g', 'g'))
+        self.graph.add_edges_from(edges)
+        self.index = ReachabilityIndex(self.graph)
+
+    def assertExact(self, graph, index):
+        for tail in graph.nodes:
+            reached = BreadthFirstSearch(graph).distances(tail)
+            for head in graph.nodes:
+                self.assertEqual(head in reached, index.reachable(tail, head),
+                                 (tail, head))
+
+    def test_reachable(self):
+        self.assertTrue(self.index.reachable('a', 'e'))
+        self.assertTrue(self.index.reachable('c', 'b'))
+        self.assertTrue(self.index.reachable('g', 'g'))
+        self.assertFalse(self.index.reachable('e', 'a'))
+        self.assertFalse(self.index.reachable('f', 'd'))
+        self.assertExact(self.graph, self.index)
+
+    def test_reachable_frozen(self):
+        frozen = self.graph.freeze()
+        self.assertExact(frozen, ReachabilityIndex(frozen))
+
+    def test_reachable_raises_no_node(self):
+        with self.assertRaises(Graph.NodeMissing):
+            self.index.reachable('a', 'x')
+
+    def test_follows_graph(self):
+        self.graph.create_node('h')
+        self.assertFalse(self.index._stale)
+        self.assertFalse(self.index.reachable('a', 'h'))
+        self.graph.create_edge('a', 'd')
+        self.assertFalse(self.index._stale)
+        self.graph.create_edge('e', 'h')
+        self.assertTrue(self.index._stale)
+        self.assertTrue(self.index.reachable('a', 'h'))
+        self.graph.remove_edge('d', 'e')
+        self.assertFalse(self.index.reachable('a', 'h'))
+        self.assertExact(self.graph, self.index)
+
+    def test_random_graphs(self):
+        random.seed(3)
+        for _ in range(5):
+            graph = Graph()
+            graph.add_nodes_from(range(40))
+            graph.add_edges_from((random.randrange(40), random.randrange(40))
+                                 for _ in range(50))
+            self.assertExact(graph, ReachabilityIndex(graph, labelings=3))
@@ -42,3 +42,17 @@ class SignalSlotTest(TestCase):
 
         self.object.slot('signal1', method1)
         self.object.signal('signal1', 1, 2, 3, 4, c=5, d=6)
+
+    def test_signal_without_slots(self):
+        self.object.signal('signal1', 1)
+        self.assertNotIn('signal1', self.object._slots)
+        self.assertNotIn('signal1', self.object._dispatch)
+
+    def test_dispatcher(self):
+        calls = []
+        self.assertIsNone(self.object.dispatcher('signal1'))
+        self.object.slot('signal1', calls.append)
+        self.assertEqual(calls.append, self.object.dispatcher('signal1'))
+        self.object.slot('signal1', calls.append)
+        self.object.dispatcher('signal1')(3)
+        self.assertEqual([3, 3], calls)
@@ -0,0 +1,103 @@
+import random
+from unittest import TestCase
+
+from jag import Graph
+from jag import IncrementalTopologicalOrder
+
+
+class IncrementalTopologicalOrderTest(TestCase):
+    def setUp(self):
+        self.graph = Graph()
+        self.graph.add_edges_from([(1, 2), (2, 3), (4, 5)])
+        self.order = IncrementalTopologicalOrder(self.graph)
+
+    def assertOrdered(self):
+        order = self.order.order()
+        self.assertCountEqual(self.graph.nodes, order)
+        position = {id: i for i, id in enumerate(order)}
+        for tail, head in self.graph.edges:
+            self.assertLess(position[tail], position[head])
+
+    def test_order(self):
+        self.assertOrdered()
+        self.assertTrue(self.order.precedes(1, 3))
+
+    def test_backward_edge_is_repaired(self):
+        self.graph.create_edge(5, 1)
+        self.assertOrdered()
+        self.graph.create_edge(6, 4)
+        self.assertOrdered()
+
+    def test_new_nodes(self):
+        self.graph.create_edge(6, 1)
+        self.graph.create_edge(3, 7)
+        self.assertOrdered()
+
+    def test_raises_at_edge_closing_cycle(self):
+        self.graph.create_edge(5, 1)
+        with self.assertRaises(Graph.CycleInDAG) as raised:
+            self.graph.create_edge(3, 4)
+        self.assertEqual([3, 4, 5, 1, 2, 3], raised.exception.cycle)
+        expect = 'Edge (3, 4) closes a cycle: 3 -> 4 -> 5 -> 1 -> 2 -> 3.'
+        self.assertEqual(expect, str(raised.exception))
+        self.assertFalse(self.graph.edge_exists(3, 4))
+        self.assertOrdered()
+
+    def test_raises_at_loop(self):
+        with self.assertRaises(Graph.CycleInDAG) as raised:
+            self.graph.create_edge(2, 2)
+        self.assertEqual([2, 2], raised.exception.cycle)
+        self.assertFalse(self.graph.edge_exists(2, 2))
+
+    def test_raises_cyclic_graph(self):
+        graph = Graph()
+        graph.add_edges_from([(1, 2), (2, 1)])
+        with self.assertRaises(Graph.CycleInDAG):
+            IncrementalTopologicalOrder(graph)
+
+    def test_remove_node(self):
+        self.graph.remove_node(2)
+        self.graph.create_edge(3, 1)
+        self.assertOrdered()
+
+    def test_random_insertions(self):
+        random.seed(7)
+        graph = Graph()
+        graph.add_nodes_from(range(50))
+        order = IncrementalTopologicalOrder(graph)
+        for _ in range(300):
+            tail, head = random.sample(range(50), 2)
+            try:
+                graph.create_edge(tail, head)
+            except Graph.CycleInDAG:
+                pass
+        graph.topological_order()
+        position = {id: i for i, id in enumerate(order.order())}
+        for tail, head in graph.edges:
+            self.assertLess(position[tail], position[head])
+
+    def test_stale_after_bulk_cycle(self):
+        graph = Graph()
+        graph.add_edges_from([(1, 2), (3, 4)])
+        order = IncrementalTopologicalOrder(graph)
+        with self.assertRaises(Graph.CycleInDAG):
+            graph.add_edges_from([(2, 1), (4, 3)])
+        self.assertFalse(graph.edge_exists(2, 1))
+        for method, args in ((order.order, ()), (order.precedes, (1, 2)),
+                             (graph.create_edge, (5, 6))):
+            with self.assertRaises(IncrementalTopologicalOrder.Stale):
+                method(*args)
+        with self.assertRaises(Graph.CycleInDAG):
+            order.rebuild()
+        graph.remove_edge(4, 3)
+        order.rebuild()
+        self.assertTrue(order.precedes(1, 2))
+        self.assertTrue(order.precedes(5, 6))
+        graph.create_edge(8, 7)
+        self.assertTrue(order.precedes(8, 7))
+
+    def test_single_cycle_keeps_order(self):
+        with self.assertRaises(Graph.CycleInDAG):
+            self.graph.create_edge(3, 1)
+        self.assertFalse(self.order._stale)
+        self.assertOrdered()